@@ -16,6 +16,7 @@ For the full list of settings and their values, see:
 https://docs.djangoproject.com/en/4.2/ref/settings/
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
@@ -163,6 +164,45 @@ else:
         }
     }
 
+# ========================================
+# Cache Configuration
+# ========================================
+# Use Redis in production, e.g. CACHE_URL=redis://localhost:6379/1
+# Defaults to a per-process in-memory cache for local development and tests.
+
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# Cached auth tokens and profiles are invalidated in whichever process handles
+# the change, so multi-process deployments need a shared cache.
+if not DEBUG and not RUNNING_TESTS and not env.str('CACHE_URL', default=''):
+    logging.getLogger(__name__).warning(
+        'CACHE_URL is not set; falling back to a per-process in-memory cache. '
+        'Set it to a shared cache (e.g. Redis) when running several workers.'
+    )
+
+# ========================================
+# Password Hashing
+# ========================================
+# https://docs.djangoproject.com/en/4.2/topics/auth/passwords/#using-argon2-with-django
+# The first hasher encodes new passwords; the rest only verify existing hashes,
+# which are upgraded to Argon2id on the user's next login.
+
+PASSWORD_HASHERS = [
+    'users.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
+# Optionally benchmark Argon2 cost at startup so one hash takes about
+# ARGON2_TARGET_MS on this host. The result is cached in ARGON2_TUNING_FILE.
+ARGON2_AUTOTUNE = env.bool('ARGON2_AUTOTUNE', default=False)
+ARGON2_TARGET_MS = env.int('ARGON2_TARGET_MS', default=250)
+ARGON2_TUNING_FILE = BASE_DIR / '.argon2_params.json'
+
 # ========================================
 # Password Validation
 # ========================================
@@ -238,7 +278,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     # Authentication classes
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',  # Primary: Token auth for API
+        'users.authentication.CachedTokenAuthentication',  # Primary: Token auth for API (cached lookup)
         'rest_framework.authentication.SessionAuthentication',  # Secondary: For Django admin
     ],
 
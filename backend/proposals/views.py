@@ -309,7 +309,7 @@ class DashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def reviewer(self, request):
         """Reviewer dashboard statistics."""
-        if not request.user.groups.filter(name='Reviewer').exists() and not request.user.is_staff:
+        if not request.user.is_staff and not request.user.has_role('Reviewer'):
             return Response({'error': 'Reviewer access required'}, status=status.HTTP_403_FORBIDDEN)
 
         from reviews.models import ReviewAssignment
@@ -332,7 +332,7 @@ class DashboardViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def pi(self, request):
         """PI dashboard statistics."""
-        if not request.user.groups.filter(name='PI').exists() and not request.user.is_staff:
+        if not request.user.is_staff and not request.user.has_role('PI'):
             return Response({'error': 'PI access required'}, status=status.HTTP_403_FORBIDDEN)
 
         proposals = Proposal.objects.filter(pi_email=request.user.email)
@@ -21,6 +21,10 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        """Prefetch groups so the Roles column costs one query per page"""
+        return super().get_queryset(request).prefetch_related('groups')
+
     def get_roles(self, obj):
         """Display user's groups/roles"""
         return ", ".join([group.name for group in obj.groups.all()])
@@ -1,5 +1,60 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class UsersConfig(AppConfig):
     name = 'users'
+
+    def ready(self):
+        from django.contrib.auth.models import Group
+        from django.contrib.auth.password_validation import get_default_password_validators
+        from django.db.models.signals import m2m_changed, post_delete, post_save
+
+        from rest_framework.authtoken.models import Token
+
+        from .authentication import revoke_deleted_token, revoke_member_tokens, revoke_user_tokens
+        from .cache import drop_member_profiles, drop_user_profile, invalidate_user_listings
+        from .serializers import clear_role_group_cache
+
+        # Role groups are cached per process; drop them if a group changes
+        post_save.connect(clear_role_group_cache, sender=Group, dispatch_uid='users_role_group_saved')
+        post_delete.connect(clear_role_group_cache, sender=Group, dispatch_uid='users_role_group_deleted')
+
+        # Cached user listing counts and ETags go stale when users, their
+        # memberships or role group names change
+        User = self.get_model('User')
+        post_save.connect(invalidate_user_listings, sender=User, dispatch_uid='users_listing_user_saved')
+        post_delete.connect(invalidate_user_listings, sender=User, dispatch_uid='users_listing_user_deleted')
+        m2m_changed.connect(
+            invalidate_user_listings, sender=User.groups.through, dispatch_uid='users_listing_groups_changed',
+        )
+        post_save.connect(invalidate_user_listings, sender=Group, dispatch_uid='users_listing_group_saved')
+        post_delete.connect(invalidate_user_listings, sender=Group, dispatch_uid='users_listing_group_deleted')
+
+        # Cached token -> user entries must not outlive a deactivation, a
+        # staff/role change or a revoked token. A deleted user's tokens are
+        # cascade-deleted, which the Token receiver covers.
+        post_save.connect(revoke_user_tokens, sender=User, dispatch_uid='users_tokens_user_saved')
+        post_delete.connect(revoke_deleted_token, sender=Token, dispatch_uid='users_tokens_token_deleted')
+        m2m_changed.connect(
+            revoke_member_tokens, sender=User.groups.through, dispatch_uid='users_tokens_groups_changed',
+        )
+
+        # Cached profiles (and the ETags built from them) follow the same changes
+        post_save.connect(drop_user_profile, sender=User, dispatch_uid='users_profile_user_saved')
+        post_delete.connect(drop_user_profile, sender=User, dispatch_uid='users_profile_user_deleted')
+        m2m_changed.connect(
+            drop_member_profiles, sender=User.groups.through, dispatch_uid='users_profile_groups_changed',
+        )
+
+        # Build the validators now so the common-password list is read at
+        # startup rather than on the first registration/import request
+        get_default_password_validators()
+
+        # Benchmark Argon2 cost on this host (cached on disk after the first run)
+        if settings.ARGON2_AUTOTUNE and not settings.RUNNING_TESTS:
+            from .hashers import configure_argon2_from_benchmark
+            configure_argon2_from_benchmark(
+                settings.ARGON2_TARGET_MS,
+                settings.ARGON2_TUNING_FILE,
+            )
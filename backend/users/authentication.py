@@ -0,0 +1,116 @@
+"""
+Token authentication backed by the Django cache.
+
+DRF's TokenAuthentication loads the token and its user from the database on
+every request. CachedTokenAuthentication keeps a snapshot of the user's
+non-sensitive columns (and primary role) in the cache for a few minutes, so
+authenticated requests skip that SELECT on a cache hit.
+
+The snapshot never contains the password hash: on a cache hit the user is
+rebuilt with the remaining columns deferred, and Django loads them on first
+access (e.g. ChangePasswordSerializer checking the old password).
+
+Anything that revokes a token or changes a user's active status or role must
+invalidate the cached entry via invalidate_token() / invalidate_user_tokens().
+Saves, token deletions and group membership changes made through the ORM
+(including the Django admin) do so through the signal receivers below, which
+UsersConfig.ready() connects; queryset update()/bulk writes must call the
+helpers themselves.
+"""
+
+import hashlib
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from .cache import changed_member_ids
+
+User = get_user_model()
+
+# Short TTL bounds how long a change made outside the API can go unnoticed
+TOKEN_CACHE_TIMEOUT = 5 * 60
+
+# User columns stored in the cache; all other columns stay deferred
+CACHED_USER_FIELDS = (
+    'id', 'username', 'email', 'first_name', 'last_name',
+    'is_active', 'is_staff', 'is_superuser',
+)
+
+
+def token_cache_key(key):
+    """Return the cache key for a token (hashed so raw tokens never hit the cache)."""
+    return 'authtok:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+def invalidate_token(key):
+    """Drop the cached authentication entry for a single token key."""
+    cache.delete(token_cache_key(key))
+
+
+def invalidate_user_tokens(user_id):
+    """Drop cached authentication entries for every token of a user."""
+    keys = Token.objects.filter(user_id=user_id).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
+
+
+def _invalidate_now_and_on_commit(func, *args):
+    # Dropping the entry again after commit stops a concurrent request from
+    # re-caching the pre-commit row in between
+    func(*args)
+    transaction.on_commit(lambda: func(*args))
+
+
+def revoke_user_tokens(sender, instance, **kwargs):
+    """Signal receiver: drop cached tokens of a saved user (active/staff/role may change)."""
+    _invalidate_now_and_on_commit(invalidate_user_tokens, instance.pk)
+
+
+def revoke_deleted_token(sender, instance, **kwargs):
+    """Signal receiver: drop the cached entry of a deleted token."""
+    _invalidate_now_and_on_commit(invalidate_token, instance.key)
+
+
+def revoke_member_tokens(sender, instance, action, reverse, pk_set, **kwargs):
+    """Signal receiver: drop cached tokens (and roles) of users whose groups change."""
+    for user_id in changed_member_ids(instance, action, reverse, pk_set):
+        _invalidate_now_and_on_commit(invalidate_user_tokens, user_id)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that resolves token -> user from the cache.
+
+    Clients still send "Authorization: Token <key>"; only the lookup changes.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+
+        if cached is None:
+            # Cache miss: one user-first query that also resolves the role,
+            # instead of the token-first join plus a groups query. Only the
+            # cached columns are selected, so a miss leaves the same columns
+            # (including the password hash) deferred as a hit.
+            try:
+                user = User.objects.only(*CACHED_USER_FIELDS).with_role().get(auth_token__key=key)
+            except User.DoesNotExist:
+                raise exceptions.AuthenticationFailed(_('Invalid token.'))
+            if not user.is_active:
+                raise exceptions.AuthenticationFailed(_('User inactive or deleted.'))
+            token = Token(key=key, user=user)
+            user._cached_role = user.role
+            cache.set(cache_key, {
+                'values': tuple(getattr(user, field) for field in CACHED_USER_FIELDS),
+                'role': user._cached_role,
+            }, TOKEN_CACHE_TIMEOUT)
+            return user, token
+
+        user = User.from_db(DEFAULT_DB_ALIAS, CACHED_USER_FIELDS, cached['values'])
+        user._cached_role = cached['role']
+        return user, Token(key=key, user=user)
@@ -0,0 +1,97 @@
+"""
+Cache keys and invalidation helpers for user data.
+
+Serialized user profiles are cached so the "who am I" endpoint does not
+rebuild the same payload (and re-query group membership) on every page load.
+Any code path that changes a user's profile, role or password must call
+invalidate_user_profile() so the next request sees fresh data; model saves
+and group membership changes do so through the drop_* signal receivers.
+"""
+
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+# Saves and group changes drop the entry through the receivers below; the
+# short TTL bounds staleness for writes that send no signals (update()).
+USER_PROFILE_CACHE_TIMEOUT = 5 * 60
+
+
+def user_profile_cache_key(user_id):
+    """Return the cache key holding the serialized profile of a user."""
+    return f'user:{user_id}:profile'
+
+
+def invalidate_user_profile(user_id):
+    """Drop the cached profile so it is rebuilt on the next request."""
+    cache.delete(user_profile_cache_key(user_id))
+
+
+def changed_member_ids(instance, action, reverse, pk_set):
+    """
+    Return the ids of users whose groups an m2m_changed signal on
+    User.groups reports as changing (empty for phases that need no action).
+
+    Reverse clears (group.user_set.clear()) are read in pre_clear, while
+    the members are still known.
+    """
+    if not reverse:
+        return [instance.pk] if action in ('post_add', 'post_remove', 'post_clear') else []
+    if action in ('post_add', 'post_remove'):
+        return list(pk_set or ())
+    if action == 'pre_clear':
+        return list(instance.user_set.values_list('pk', flat=True))
+    return []
+
+
+def drop_user_profile(sender, instance, **kwargs):
+    """Signal receiver: drop the cached profile of a saved or deleted user."""
+    invalidate_user_profile(instance.pk)
+    transaction.on_commit(lambda: invalidate_user_profile(instance.pk))
+
+
+def drop_member_profiles(sender, instance, action, reverse, pk_set, **kwargs):
+    """Signal receiver: drop cached profiles of users whose groups (role) change."""
+    for user_id in changed_member_ids(instance, action, reverse, pk_set):
+        invalidate_user_profile(user_id)
+        transaction.on_commit(lambda user_id=user_id: invalidate_user_profile(user_id))
+
+
+# Every write that adds, removes, edits or re-roles users replaces the listing
+# version, which keys the cached listing counts and the listing ETags. The
+# version is random rather than a counter, so a version lost to cache eviction
+# can never come back and revalidate a stale ETag.
+USER_LISTING_VERSION_KEY = 'users:listing:version'
+
+# Listing counts only feed pagination metadata, so a minute of staleness is
+# acceptable even for writes that bypass invalidate_user_listings()
+USER_COUNT_CACHE_TIMEOUT = 60
+
+
+def user_listing_version():
+    """Return the current version of user listing data."""
+    return cache.get_or_set(USER_LISTING_VERSION_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def user_count_cache_key(sql):
+    """Return the cache key holding the row count of a user listing query."""
+    digest = hashlib.md5(sql.encode(), usedforsecurity=False).hexdigest()
+    return f'users:count:{user_listing_version()}:{digest}'
+
+
+def _new_listing_version():
+    cache.set(USER_LISTING_VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def invalidate_user_listings(**kwargs):
+    """
+    Forget cached listing counts and ETags (also usable as a signal receiver).
+
+    The version is replaced immediately and again once the surrounding
+    transaction commits, so a listing read between the two cannot be cached
+    under the new version with pre-commit data.
+    """
+    _new_listing_version()
+    transaction.on_commit(_new_listing_version)
@@ -0,0 +1,128 @@
+"""
+Password hashers for the CTRG Grant System.
+
+Django's stock Argon2PasswordHasher uses 100 MiB / t=2 / p=8, which is more
+than a single request worker should spend per login. The parameters below
+follow the OWASP Argon2id recommendation (46 MiB, t=1, p=1): strong GPU
+resistance at a lower CPU cost than PBKDF2 at its current iteration count.
+
+Hashes created with other parameters or hashers still verify and are
+transparently re-encoded on the user's next successful login.
+
+When ARGON2_AUTOTUNE is enabled, the parameters are instead chosen once per
+host by configure_argon2_from_benchmark() so that a single hash takes about
+ARGON2_TARGET_MS on the deployment hardware.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import time
+
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+logger = logging.getLogger(__name__)
+
+# Memory sizes (MiB) tried by the benchmark, smallest first. 19 MiB is the
+# OWASP floor and is used even if the host is slower than the target; sizes
+# at or above typical L3 cache keep the measurement memory-bound.
+ARGON2_MEMORY_CANDIDATES_MIB = (19, 46, 64, 128)
+ARGON2_MAX_TIME_COST = 10
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id hasher tuned for per-request verification.
+
+    parallelism=1 because each login is verified on a single worker thread,
+    so extra lanes add memory traffic without making verification faster.
+    """
+
+    time_cost = 1
+    memory_cost = 46 * 1024  # KiB (46 MiB)
+    parallelism = 1
+
+
+def _measure_hash_ms(argon2, time_cost, memory_cost):
+    """Return the best of two hash timings (ms) for the given parameters."""
+    hasher = argon2.PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=1,
+    )
+    timings = []
+    for _ in range(2):
+        start = time.perf_counter_ns()
+        hasher.hash('benchmark')
+        timings.append((time.perf_counter_ns() - start) / 1_000_000)
+    return min(timings)
+
+
+def benchmark_argon2_parameters(target_ms):
+    """
+    Pick Argon2id parameters whose hash time stays within target_ms.
+
+    Memory is preferred over iterations: the largest candidate memory size
+    within budget is chosen at t=1, and time_cost is only raised when the
+    largest memory size still leaves headroom.
+
+    Args:
+        target_ms (int): Target duration of a single hash in milliseconds
+
+    Returns:
+        dict: time_cost, memory_cost (KiB) and parallelism
+    """
+    argon2 = TunedArgon2PasswordHasher()._load_library()
+
+    memory_cost = ARGON2_MEMORY_CANDIDATES_MIB[0] * 1024
+    for memory_mib in ARGON2_MEMORY_CANDIDATES_MIB:
+        if _measure_hash_ms(argon2, 1, memory_mib * 1024) > target_ms:
+            break
+        memory_cost = memory_mib * 1024
+
+    time_cost = 1
+    if memory_cost == ARGON2_MEMORY_CANDIDATES_MIB[-1] * 1024:
+        while (
+            time_cost < ARGON2_MAX_TIME_COST
+            and _measure_hash_ms(argon2, time_cost + 1, memory_cost) <= target_ms
+        ):
+            time_cost += 1
+
+    return {'time_cost': time_cost, 'memory_cost': memory_cost, 'parallelism': 1}
+
+
+def configure_argon2_from_benchmark(target_ms, cache_path):
+    """
+    Apply benchmarked parameters to TunedArgon2PasswordHasher.
+
+    Results are stored in cache_path so only the first process on a host
+    pays for the benchmark; every later worker start reads the file.
+
+    Args:
+        target_ms (int): Target duration of a single hash in milliseconds
+        cache_path (str | Path): JSON file holding the tuned parameters
+    """
+    params = None
+    try:
+        with open(cache_path) as fh:
+            cached = json.load(fh)
+        if cached.get('target_ms') == target_ms:
+            params = cached['params']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    if params is None:
+        params = benchmark_argon2_parameters(target_ms)
+        logger.info("Tuned Argon2 parameters for %sms target: %s", target_ms, params)
+        try:
+            directory = os.path.dirname(os.fspath(cache_path)) or '.'
+            with tempfile.NamedTemporaryFile('w', dir=directory, delete=False) as fh:
+                json.dump({'target_ms': target_ms, 'params': params}, fh)
+            os.replace(fh.name, cache_path)
+        except OSError:
+            logger.warning("Could not write Argon2 tuning cache to %s", cache_path)
+
+    TunedArgon2PasswordHasher.time_cost = params['time_cost']
+    TunedArgon2PasswordHasher.memory_cost = params['memory_cost']
+    TunedArgon2PasswordHasher.parallelism = params['parallelism']
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:16
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import proposals.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_user_email_upper_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewerImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(blank=True, null=True, storage=proposals.storage.EncryptedFileStorage(), upload_to='reviewer_imports/')),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20)),
+                ('total_rows', models.PositiveIntegerField(default=0)),
+                ('processed_rows', models.PositiveIntegerField(default=0)),
+                ('result', models.JSONField(blank=True, help_text='created/errors payload, same shape as the synchronous import response.', null=True)),
+                ('error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('created_by', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewer_import_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
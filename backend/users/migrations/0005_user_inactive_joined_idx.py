@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_reviewer_import_job'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('is_active', False)), fields=['-date_joined'], name='user_inactive_joined_idx'),
+        ),
+    ]
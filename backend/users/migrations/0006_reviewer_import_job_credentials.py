@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-16 04:48
+
+from django.db import migrations, models
+import proposals.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_user_inactive_joined_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='reviewerimportjob',
+            name='credentials',
+            field=models.FileField(blank=True, null=True, storage=proposals.storage.EncryptedFileStorage(), upload_to='reviewer_import_credentials/'),
+        ),
+    ]
@@ -1,5 +1,80 @@
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as BaseUserManager
 from django.db import models
+from django.db.models import Case, CharField, Exists, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Concat, Upper
+
+from proposals.storage import EncryptedFileStorage
+
+encrypted_storage = EncryptedFileStorage()
+
+
+class UserQuerySet(models.QuerySet):
+    """
+    QuerySet helpers for resolving role information in SQL.
+    """
+
+    # Group names of the fixed roles
+    ROLE_NAMES = ('PI', 'Reviewer', 'SRC_Chair')
+
+    def with_role(self):
+        """
+        Annotate each user with ``role``: the name of their primary (first) group.
+
+        Uses a correlated subquery so the result keeps one row per user and
+        serializers can read the role as a plain attribute.
+        """
+        memberships = self.model.groups.through.objects.filter(
+            user_id=OuterRef('pk')
+        ).order_by('group_id').values('group__name')[:1]
+        return self.annotate(role=Subquery(memberships))
+
+    def in_role(self, name):
+        """
+        Filter to members of the role group ``name``.
+
+        An EXISTS subquery rather than a ``groups__name`` join, so the outer
+        query keeps one row per user and stays compatible with annotations.
+        """
+        through = self.model.groups.through
+        return self.filter(Exists(through.objects.filter(user_id=OuterRef('pk'), group__name=name)))
+
+    def in_group(self, group):
+        """
+        Filter to members of ``group`` (a resolved Group or its pk).
+
+        Like in_role(), but the EXISTS subquery is a lookup on the
+        user-groups (user_id, group_id) index, without joining auth_group.
+        """
+        through = self.model.groups.through
+        return self.filter(Exists(through.objects.filter(user_id=OuterRef('pk'), group_id=getattr(group, 'pk', group))))
+
+    def with_group_flag(self, flag, group):
+        """
+        Annotate each user with boolean ``flag``: membership of ``group``.
+
+        Takes a resolved Group (or its pk) so the EXISTS subquery reads only
+        the user-groups table, without joining auth_group to match a name.
+        """
+        through = self.model.groups.through
+        return self.annotate(**{
+            flag: Exists(through.objects.filter(user_id=OuterRef('pk'), group_id=getattr(group, 'pk', group)))
+        })
+
+    def with_full_name(self):
+        """
+        Annotate each user with ``full_name``: "first last", or the email when
+        either name part is blank.
+        """
+        return self.annotate(full_name=Case(
+            When(Q(first_name='') | Q(last_name=''), then=F('email')),
+            default=Concat('first_name', Value(' '), 'last_name'),
+            output_field=CharField(),
+        ))
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    pass
+
 
 class User(AbstractUser):
     """
@@ -11,5 +86,61 @@ class User(AbstractUser):
     
     # Roles will be handled via Django Groups ("PI", "Reviewer", "Admin", "SRC_Chair")
 
+    objects = UserManager()
+
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Serves case-insensitive login lookups (email__iexact compiles to UPPER())
+            models.Index(Upper('email'), name='user_email_upper_idx'),
+            # Serves the newest-first pending (inactive) reviewer listing
+            models.Index(
+                fields=['-date_joined'], condition=Q(is_active=False), name='user_inactive_joined_idx',
+            ),
+        ]
+
     def __str__(self):
         return self.email
+
+    def has_role(self, name):
+        """
+        Return whether the user belongs to the role group ``name``.
+
+        A role already resolved for this user (by CachedTokenAuthentication,
+        login, or a with_role() queryset) answers a match without a query;
+        the token cache is dropped on every group membership change, so that
+        role is current. Anything else is checked in SQL, so users in several
+        groups are still handled correctly.
+        """
+        if getattr(self, '_cached_role', None) == name or self.__dict__.get('role') == name:
+            return True
+        return self.groups.filter(name=name).exists()
+
+
+class ReviewerImportJob(models.Model):
+    """
+    A reviewer spreadsheet import processed in the background by Celery.
+    Holds the uploaded workbook until it is processed and the final result.
+    Generated temporary passwords are kept out of ``result`` and stored in
+    ``credentials`` until the one-time download.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        RUNNING = 'RUNNING', 'Running'
+        COMPLETED = 'COMPLETED', 'Completed'
+        FAILED = 'FAILED', 'Failed'
+
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='reviewer_import_jobs')
+    # Encrypted at rest: sheets may carry passwords. Deleted once processed.
+    file = models.FileField(upload_to='reviewer_imports/', storage=encrypted_storage, null=True, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    total_rows = models.PositiveIntegerField(default=0)
+    processed_rows = models.PositiveIntegerField(default=0)
+    # Encrypted JSON of generated temporary passwords, deleted once downloaded
+    credentials = models.FileField(upload_to='reviewer_import_credentials/', storage=encrypted_storage, null=True, blank=True)
+    result = models.JSONField(null=True, blank=True, help_text="created/errors payload, same shape as the synchronous import response.")
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Reviewer import #{self.pk} ({self.status})"
@@ -0,0 +1,39 @@
+"""
+Pagination classes for the users module.
+"""
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+from .cache import USER_COUNT_CACHE_TIMEOUT, user_count_cache_key
+
+
+class CachedCountPaginator(Paginator):
+    """Paginator that reads the total row count from the cache."""
+
+    @cached_property
+    def count(self):
+        if self.object_list.query.is_empty():
+            # .none() querysets have no SQL to key the cache on
+            return 0
+        key = user_count_cache_key(str(self.object_list.query))
+        return cache.get_or_set(key, self.object_list.count, USER_COUNT_CACHE_TIMEOUT)
+
+
+class UserPagination(PageNumberPagination):
+    """PageNumberPagination for user listings, with a client-chosen page size."""
+
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+class CachedCountPagination(UserPagination):
+    """
+    UserPagination whose COUNT(*) is cached per listing query.
+
+    Only for user querysets: the cached counts are invalidated by
+    invalidate_user_listings(), which runs whenever users or their groups change.
+    """
+
+    django_paginator_class = CachedCountPaginator
@@ -0,0 +1,52 @@
+"""
+Response renderers for the users module.
+"""
+import json
+
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class NDJSONRenderer(BaseRenderer):
+    """
+    Newline-delimited JSON.
+
+    Lets views negotiate "Accept: application/x-ndjson"; streamed bodies are
+    produced by the view itself, while ordinary Response data (e.g. errors)
+    renders as a single JSON line.
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return (json.dumps(data, cls=JSONEncoder) + '\n').encode(self.charset)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed.
+
+    Falls back to DRF's encoder when orjson is missing, when indented output
+    is requested (e.g. by the browsable API), or for values orjson cannot
+    encode natively (lazy translation strings, Decimal, ...), so responses
+    are the same either way.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NAIVE_UTC)
+        except TypeError:
+            return super().render(data, accepted_media_type, renderer_context)
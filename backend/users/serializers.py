@@ -8,20 +8,90 @@ Serializers:
     - UserSerializer: Full user profile with role information
     - LoginSerializer: Email/password validation for login
     - UserCreateSerializer: User registration with role assignment
+    - ReviewerImportRowSerializer: Per-row validation for reviewer imports
+    - ReviewerBulkApprovalSerializer: Id list for bulk reviewer approval
+    - ReviewerImportJobSerializer: Background reviewer import status
     - ChangePasswordSerializer: Password change validation
     - UserListSerializer: Summary user information for listings
 """
 
+import hmac
+
 from rest_framework import serializers
-from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.contrib.auth.validators import UnicodeUsernameValidator
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+from django.urls import reverse
+
+from .cache import invalidate_user_profile
+from .models import ReviewerImportJob
 
 # Get the custom User model
 User = get_user_model()
 
 
+# Role groups ('PI', 'Reviewer', 'SRC_Chair') are fixed at runtime, so the
+# Group rows are cached per process. Cleared by a Group post_save/post_delete
+# signal (see UsersConfig.ready).
+_GROUP_CACHE = {}
+
+
+def _get_role_group(name):
+    """
+    Return the Group for a role name, creating it on first use.
+
+    A group is only cached once the surrounding transaction commits, so a
+    row created inside a rolled-back transaction is never handed out.
+    """
+    group = _GROUP_CACHE.get(name)
+    if group is None:
+        group, _ = Group.objects.get_or_create(name=name)
+        transaction.on_commit(lambda: _GROUP_CACHE.setdefault(name, group))
+    return group
+
+
+def _find_role_group(name):
+    """
+    Return the Group for a role name, or None if it does not exist yet.
+
+    Read-only counterpart of _get_role_group for listing paths, which
+    should not create groups as a side effect of a GET.
+    """
+    group = _GROUP_CACHE.get(name)
+    if group is None:
+        group = Group.objects.filter(name=name).first()
+        if group is not None:
+            transaction.on_commit(lambda: _GROUP_CACHE.setdefault(name, group))
+    return group
+
+
+def clear_role_group_cache(**kwargs):
+    """Signal receiver: forget cached role groups after a Group changes."""
+    _GROUP_CACHE.clear()
+
+
+def _primary_role(user):
+    """
+    Return the name of the user's primary (first) group, or None.
+
+    Reads from ``groups.all()`` so a queryset built with
+    ``prefetch_related('groups')`` resolves the role without extra SQL.
+    """
+    # Role resolved earlier in the request (e.g. during login) - no query needed
+    if hasattr(user, '_cached_role'):
+        return user._cached_role
+
+    # Role annotated by User.objects.with_role()
+    if 'role' in user.__dict__:
+        return user.role
+
+    groups = user.groups.all()
+    return groups[0].name if groups else None
+
+
 class UserSerializer(serializers.ModelSerializer):
     """
     Complete user profile serializer with role information.
@@ -68,9 +138,50 @@ class UserSerializer(serializers.ModelSerializer):
         Returns:
             str: Role name ('PI', 'Reviewer', 'SRC_Chair') or None if no group assigned
         """
-        # Get the first group as the primary role
-        group = obj.groups.first()
-        return group.name if group else None
+        return _primary_role(obj)
+
+    def to_representation(self, instance):
+        """
+        Build the output dict directly instead of walking the declared fields.
+
+        The output shape is fixed and this serializer runs on every login and
+        profile request, so skipping DRF's per-field bind/get_attribute round
+        trip is worthwhile. Meta.fields is still used for input handling.
+
+        Args:
+            instance (User): User instance
+
+        Returns:
+            dict: Serialized user profile
+        """
+        return {
+            'id': instance.id,
+            'username': instance.username,
+            'email': instance.email,
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'role': self.get_role(instance),
+            'is_active': instance.is_active,
+            'is_staff': instance.is_staff,
+        }
+
+
+# to_representation() reads no per-instance state, so one unbound instance
+# can render every profile without re-running Serializer.__init__
+_PROFILE_SERIALIZER = UserSerializer()
+
+
+def serialize_user(user):
+    """
+    Return the UserSerializer profile dict for ``user``.
+
+    Args:
+        user (User): User instance
+
+    Returns:
+        dict: Serialized user profile
+    """
+    return _PROFILE_SERIALIZER.to_representation(user)
 
 
 class LoginSerializer(serializers.Serializer):
@@ -116,37 +227,67 @@ class LoginSerializer(serializers.Serializer):
         email = attrs.get('email')
         password = attrs.get('password')
 
-        # Check if user exists with this email
-        try:
-            matched_user = User.objects.get(email=email)
-        except User.DoesNotExist:
+        # Single case-insensitive lookup by email (backed by a functional
+        # index); the password is verified against the matched row
+        # directly instead of going through authenticate(), which would fetch
+        # the same user again by username. The role is resolved in the same
+        # query so the login response needs no groups lookup.
+        candidates = list(User.objects.with_role().filter(email__iexact=email))
+        user, password_verified = self._match_login_user(candidates, email, password)
+        if user is None:
             raise serializers.ValidationError({
                 'email': 'No user found with this email address.'
             })
 
-        # Django authenticate() returns None for inactive users, so check first
-        # to return an accurate business message for pending reviewer accounts.
-        if not matched_user.is_active:
+        # Check activity first to return an accurate business message for
+        # pending reviewer accounts.
+        if not user.is_active:
             raise serializers.ValidationError({
                 'non_field_errors': 'This user account has been disabled.'
             })
 
-        # Authenticate with username (since Django uses username for auth)
-        user = authenticate(
-            request=self.context.get('request'),
-            username=matched_user.username,  # Use username for authentication
-            password=password
-        )
-
-        if not user:
+        # check_password() also upgrades hashes made with an outdated hasher;
+        # skipped when matching the email already verified it
+        if not password_verified and not user.check_password(password):
             raise serializers.ValidationError({
                 'password': 'Incorrect password.'
             })
 
-        # Add authenticated user to validated data
+        # Keep the role on the instance for serializers reading _primary_role()
+        user._cached_role = user.role
+
+        # Add authenticated user and role to validated data
         attrs['user'] = user
+        attrs['role'] = user._cached_role
         return attrs
 
+    @staticmethod
+    def _match_login_user(candidates, email, password):
+        """
+        Pick the account a login email refers to.
+
+        The email unique constraint is case-sensitive, so addresses differing
+        only in case can belong to different users: an exact match wins, and
+        among case-variants only one whose password verifies is chosen.
+
+        Args:
+            candidates (list): Users whose email matches case-insensitively
+            email (str): Email as entered
+            password (str): Password as entered
+
+        Returns:
+            tuple: (matched User or None if there are no candidates, whether
+                ``password`` was already verified against it)
+        """
+        for candidate in candidates:
+            if candidate.email == email:
+                return candidate, False
+        if len(candidates) > 1:
+            for candidate in candidates:
+                if candidate.is_active and candidate.check_password(password):
+                    return candidate, True
+        return (candidates[0] if candidates else None), False
+
 
 class UserCreateSerializer(serializers.ModelSerializer):
     """
@@ -166,7 +307,7 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
     Validation:
         - Password must meet Django's password validation requirements
-        - Email must be unique
+        - Email must be unique (enforced by the database unique index on save)
         - Username must be unique
         - Role must be one of the three valid roles
 
@@ -200,25 +341,12 @@ class UserCreateSerializer(serializers.ModelSerializer):
         extra_kwargs = {
             'first_name': {'required': True},
             'last_name': {'required': True},
+            # No UniqueValidator: the unique index on email is checked on
+            # INSERT in create(), saving a SELECT and closing the race window.
+            'email': {'validators': []},
         }
 
-    def validate_email(self, value):
-        """
-        Ensure email is unique across all users.
-
-        Args:
-            value (str): Email address to validate
-
-        Returns:
-            str: Validated email address
-
-        Raises:
-            ValidationError: If email already exists
-        """
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return value
-
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create new user with hashed password and role assignment.
@@ -231,30 +359,103 @@ class UserCreateSerializer(serializers.ModelSerializer):
 
         Returns:
             User: Newly created user instance with assigned role
+
+        Raises:
+            ValidationError: If a user with this email already exists
         """
         # Extract role from validated data (not a User model field)
         role = validated_data.pop('role')
 
-        # Create user with hashed password
-        user = User.objects.create_user(**validated_data)
-
-        # Assign user to the specified role group
+        # Create user with hashed password. The savepoint keeps the outer
+        # transaction usable if the unique email index rejects the row.
         try:
-            group = Group.objects.get(name=role)
-            user.groups.add(group)
-        except Group.DoesNotExist:
-            # If group doesn't exist, create it and assign
-            group = Group.objects.create(name=role)
-            user.groups.add(group)
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+        except IntegrityError:
+            if User.objects.filter(email=validated_data['email']).exists():
+                raise serializers.ValidationError({
+                    'email': ['A user with this email already exists.']
+                })
+            raise
+
+        # Assign user to the specified role group (created on first use).
+        # get_or_create relies on the unique group name, so concurrent
+        # registrations cannot both try to insert a missing group.
+        user.groups.add(_get_role_group(role))
 
         # Create ReviewerProfile if role is Reviewer
         if role == 'Reviewer':
             from reviews.models import ReviewerProfile
             ReviewerProfile.objects.create(user=user, area_of_expertise='')
 
+        # Drop any stale profile cached under a reused primary key
+        invalidate_user_profile(user.pk)
+
         return user
 
 
+class ReviewerImportRowSerializer(UserCreateSerializer):
+    """
+    Validates one row of a reviewer spreadsheet import.
+
+    Identical to UserCreateSerializer except that username uniqueness is not
+    checked per row: ReviewerImportService compares each row against
+    usernames fetched for the whole sheet in one query.
+    """
+
+    class Meta(UserCreateSerializer.Meta):
+        extra_kwargs = {
+            **UserCreateSerializer.Meta.extra_kwargs,
+            'username': {'validators': [UnicodeUsernameValidator()]},
+        }
+
+
+class ReviewerBulkApprovalSerializer(serializers.Serializer):
+    """
+    Input for approving several pending reviewers in one request.
+
+    Example:
+        {"ids": [4, 7, 9]}
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500,
+    )
+
+
+class ReviewerImportJobSerializer(serializers.ModelSerializer):
+    """
+    Status of a background reviewer import, polled by the client.
+
+    ``result`` is populated once the job finishes and has the same shape as
+    the synchronous import response, minus the temporary passwords: those
+    are downloaded once from ``credentials_url``.
+    """
+
+    credentials_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReviewerImportJob
+        fields = [
+            'id', 'status', 'total_rows', 'processed_rows', 'result', 'error',
+            'credentials_url', 'created_at', 'finished_at',
+        ]
+        read_only_fields = fields
+
+    def get_credentials_url(self, obj):
+        """
+        Get the one-time download URL for generated temporary passwords.
+
+        Returns:
+            str: URL path, or None once downloaded or if none were generated
+        """
+        if not obj.credentials:
+            return None
+        return reverse('users:import-reviewers-credentials', args=[obj.pk])
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Password change serializer for authenticated users.
@@ -321,7 +522,8 @@ class ChangePasswordSerializer(serializers.Serializer):
         Raises:
             ValidationError: If new password is same as old password
         """
-        if attrs['old_password'] == attrs['new_password']:
+        # Constant-time comparison: both values are secrets
+        if hmac.compare_digest(attrs['old_password'].encode(), attrs['new_password'].encode()):
             raise serializers.ValidationError({
                 'new_password': 'New password must be different from the old password.'
             })
@@ -339,10 +541,33 @@ class ChangePasswordSerializer(serializers.Serializer):
         """
         user = self.context['request'].user
         user.set_password(self.validated_data['new_password'])
-        user.save()
+        # Only the hash changed - avoid rewriting every column of the row
+        user.save(update_fields=['password'])
+        invalidate_user_profile(user.pk)
         return user
 
 
+class UserListListSerializer(serializers.ListSerializer):
+    """
+    ListSerializer for output-only listings.
+
+    Resolves the child's readable fields once per list rather than once
+    per row, then renders each row with a plain loop.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = [(field.field_name, field) for field in self.child._readable_fields]
+        rows = []
+        for item in iterable:
+            row = {}
+            for name, field in fields:
+                attribute = field.get_attribute(item)
+                row[name] = None if attribute is None else field.to_representation(attribute)
+            rows.append(row)
+        return rows
+
+
 class UserListSerializer(serializers.ModelSerializer):
     """
     Lightweight user serializer for user listings.
@@ -369,39 +594,16 @@ class UserListSerializer(serializers.ModelSerializer):
         }
     """
 
-    role = serializers.SerializerMethodField()
-    full_name = serializers.SerializerMethodField()
+    # Annotated by User.objects.with_role() / with_full_name() - querysets must include them
+    role = serializers.CharField(read_only=True, allow_null=True)
+    full_name = serializers.CharField(read_only=True)
 
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'full_name', 'role', 'is_active', 'date_joined']
-
-    def get_role(self, obj):
-        """
-        Get user's primary role from group membership.
-
-        Args:
-            obj (User): User instance
-
-        Returns:
-            str: Role name or None
-        """
-        group = obj.groups.first()
-        return group.name if group else None
-
-    def get_full_name(self, obj):
-        """
-        Get user's full name from first and last name.
-
-        Args:
-            obj (User): User instance
-
-        Returns:
-            str: Full name or email if name not set
-        """
-        if obj.first_name and obj.last_name:
-            return f"{obj.first_name} {obj.last_name}"
-        return obj.email
+        # Output-only: skips building writable fields (e.g. the username UniqueValidator)
+        read_only_fields = fields
+        list_serializer_class = UserListListSerializer
 
 
 class ReviewerRegistrationSerializer(serializers.ModelSerializer):
@@ -504,6 +706,7 @@ class ReviewerRegistrationSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("A user with this username already exists.")
         return value
 
+    @transaction.atomic
     def create(self, validated_data):
         """
         Create new reviewer user with hashed password and Reviewer role.
@@ -546,16 +749,9 @@ class ReviewerRegistrationSerializer(serializers.ModelSerializer):
         # ====================================================================
         # STEP 3: Assign to Reviewer group
         # ====================================================================
-        # Group membership determines role/permissions in the system
-        try:
-            # Try to get existing Reviewer group
-            group = Group.objects.get(name='Reviewer')
-            user.groups.add(group)
-        except Group.DoesNotExist:
-            # Create Reviewer group if it doesn't exist
-            # (Useful for fresh installations)
-            group = Group.objects.create(name='Reviewer')
-            user.groups.add(group)
+        # Group membership determines role/permissions in the system.
+        # The group is created on first use (useful for fresh installations).
+        user.groups.add(_get_role_group('Reviewer'))
 
         # ====================================================================
         # STEP 4: Create ReviewerProfile
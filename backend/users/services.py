@@ -0,0 +1,518 @@
+"""
+Business Logic Services for Users Module.
+Handles bulk creation of reviewer accounts from spreadsheet imports and
+approval of pending reviewer registrations.
+"""
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.crypto import get_random_string
+
+from .cache import invalidate_user_listings, invalidate_user_profile
+from .serializers import ReviewerImportRowSerializer, _get_role_group
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+def _normalize_header(value):
+    return str(value).strip().lower().replace(' ', '_') if value is not None else ''
+
+
+def _username_base(email):
+    return email.split('@')[0].strip().lower().replace(' ', '.') or 'reviewer'
+
+
+def _generate_unique_username(email, existing):
+    """
+    Derive a username from the email local part that is not in ``existing``.
+
+    Args:
+        email (str): Reviewer email address
+        existing (set): Usernames already taken, in the database or earlier
+            in this import
+
+    Returns:
+        str: ``base``, or ``base`` with the lowest free numeric suffix
+    """
+    base = _username_base(email)
+    candidate = base
+    suffix = 1
+    while candidate in existing:
+        candidate = f"{base}{suffix}"
+        suffix += 1
+    return candidate
+
+
+def _generate_temp_password():
+    # Meets minimum length and avoids common-password/numeric-only failures.
+    return f"Rvwr!{get_random_string(10)}"
+
+
+def _calamine_cell(value):
+    # calamine reports every number as float and blank cells as '';
+    # match openpyxl so e.g. 87654321 is not read as "87654321.0".
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def open_xlsx_rows(upload):
+    """
+    Open the first worksheet of an .xlsx upload for row iteration.
+
+    Uses python-calamine (native parser) when installed, otherwise openpyxl
+    in read-only mode. Both stream rows and yield the same cell values.
+
+    Args:
+        upload: Uploaded .xlsx file object
+
+    Returns:
+        tuple: (iterable of row tuples, callable that releases the workbook)
+
+    Raises:
+        Exception: Whatever the parser raises for an unreadable workbook
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_filelike(upload)
+        rows = workbook.get_sheet_by_index(0).iter_rows()
+        return (tuple(_calamine_cell(value) for value in row) for row in rows), lambda: None
+
+    from openpyxl import load_workbook
+    # read_only streams rows from the archive instead of building every cell object
+    workbook = load_workbook(filename=upload, data_only=True, read_only=True)
+    return workbook.active.iter_rows(values_only=True), workbook.close
+
+
+class ReviewerImportService:
+    """Bulk import of reviewer accounts from spreadsheet rows."""
+
+    HEADER_ALIASES = {
+        'first_name': {'first_name', 'firstname', 'first'},
+        'last_name': {'last_name', 'lastname', 'last'},
+        'email': {'email', 'email_address', 'mail'},
+        'username': {'username', 'user_name', 'user'},
+        'password': {'password', 'pass', 'temp_password'},
+    }
+    # Normalized header -> field, so matching the header is a single pass
+    HEADER_TO_FIELD = {alias: field for field, names in HEADER_ALIASES.items() for alias in names}
+    REQUIRED_COLUMNS = ['first_name', 'last_name', 'email']
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def import_rows(rows):
+        """
+        Validate spreadsheet rows and create one reviewer account per valid row.
+
+        Args:
+            rows (iterable): Row tuples; the first row is the header. Consumed
+                lazily, so a streaming sheet iterator can be passed directly.
+
+        Returns:
+            dict: created_count, error_count, created and errors lists
+
+        Raises:
+            ValueError: If the sheet is empty or required columns are missing
+        """
+        return ReviewerImportService.run(ReviewerImportService.parse_rows(rows))
+
+    @staticmethod
+    def run(parsed):
+        """
+        Import parsed rows and collect every outcome into one result.
+
+        Args:
+            parsed (list): Output of parse_rows()
+
+        Returns:
+            dict: created_count, error_count, created and errors lists
+        """
+        created = []
+        errors = []
+        for outcome, entry in ReviewerImportService.iter_import(parsed):
+            (created if outcome == 'created' else errors).append(entry)
+
+        return {
+            'created_count': len(created),
+            'error_count': len(errors),
+            'created': created,
+            'errors': errors,
+        }
+
+    @staticmethod
+    def parse_rows(rows):
+        """
+        Map the header to fields and extract the stripped cells of each row.
+
+        Args:
+            rows (iterable): Row tuples; the first row is the header
+
+        Returns:
+            list: (spreadsheet row number, {field: value}) pairs, blank rows
+                skipped
+
+        Raises:
+            ValueError: If the sheet is empty or required columns are missing
+        """
+        rows = iter(rows)
+        header_row = next(rows, None)
+        if header_row is None:
+            raise ValueError('The Excel file is empty.')
+
+        header = [_normalize_header(cell) for cell in header_row]
+        index_map = {}
+        for idx, col in enumerate(header):
+            field = ReviewerImportService.HEADER_TO_FIELD.get(col)
+            if field:
+                index_map.setdefault(field, idx)
+
+        missing = [field for field in ReviewerImportService.REQUIRED_COLUMNS if field not in index_map]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+        # (field, column index or None) resolved once, not per cell
+        columns = [(field, index_map.get(field)) for field in ReviewerImportService.HEADER_ALIASES]
+
+        parsed = []
+        for row_idx, row in enumerate(rows, start=2):
+            if not row:
+                continue
+            width = len(row)
+            cells = {}
+            for field, idx in columns:
+                value = row[idx] if idx is not None and idx < width else None
+                cells[field] = str(value).strip() if value is not None else ''
+            # Only rows with no mapped value need the full blank-row scan
+            if not any(cells.values()) and all(cell is None or str(cell).strip() == '' for cell in row):
+                continue
+            parsed.append((row_idx, cells))
+        return parsed
+
+    @staticmethod
+    def iter_import(parsed):
+        """
+        Validate parsed rows and create accounts, yielding each row's outcome.
+
+        Rows are validated individually; valid accounts are buffered and
+        written every BATCH_SIZE rows (see create_reviewers), so outcomes
+        for created rows are yielded once their batch has been saved.
+
+        Args:
+            parsed (list): Output of parse_rows()
+
+        Yields:
+            tuple: ('created', row dict) or ('error', row dict)
+        """
+        # Emails and usernames already registered, fetched once for the sheet
+        taken_emails = set(User.objects.filter(
+            email__in={User.objects.normalize_email(cells['email']) for _, cells in parsed}
+        ).values_list('email', flat=True))
+        # Supplied usernames plus every "<base><digits>" name a generated
+        # username could collide with; allocation then happens in memory
+        supplied = {cells['username'] for _, cells in parsed if cells['username']}
+        bases = {_username_base(cells['email']) for _, cells in parsed if not cells['username']}
+        usernames_query = Q(username__in=supplied)
+        if bases:
+            pattern = '|'.join(re.escape(base) for base in sorted(bases))
+            usernames_query |= Q(username__regex=rf'^({pattern})[0-9]*$')
+        usernames_in_use = set(
+            User.objects.filter(usernames_query).values_list('username', flat=True)
+        )
+
+        pending = []
+
+        for row_idx, cells in parsed:
+            email = cells['email']
+            username = cells['username'] or _generate_unique_username(email, usernames_in_use)
+            supplied_password = cells['password']
+            password = supplied_password or _generate_temp_password()
+
+            payload = {
+                'username': username,
+                'email': email,
+                'password': password,
+                'first_name': cells['first_name'],
+                'last_name': cells['last_name'],
+                'role': 'Reviewer',
+            }
+
+            # Validation only - accounts are created in bulk below
+            serializer = ReviewerImportRowSerializer(data=payload)
+            if not serializer.is_valid():
+                yield 'error', {'row': row_idx, 'email': email, 'errors': serializer.errors}
+                continue
+
+            data = serializer.validated_data
+            normalized_email = User.objects.normalize_email(data['email'])
+            username = User.normalize_username(data['username'])
+            if normalized_email in taken_emails:
+                yield 'error', {
+                    'row': row_idx,
+                    'email': email,
+                    'errors': {'email': ['A user with this email already exists.']},
+                }
+                continue
+            if username in usernames_in_use:
+                yield 'error', {
+                    'row': row_idx,
+                    'email': email,
+                    'errors': {'username': ['A user with that username already exists.']},
+                }
+                continue
+
+            taken_emails.add(normalized_email)
+            usernames_in_use.add(username)
+            pending.append({
+                'row': row_idx,
+                'user': User(
+                    username=username,
+                    email=normalized_email,
+                    first_name=data['first_name'],
+                    last_name=data['last_name'],
+                ),
+                'password': data['password'],
+                'temporary': not supplied_password,
+            })
+
+            if len(pending) >= ReviewerImportService.BATCH_SIZE:
+                yield from ReviewerImportService._flush(pending)
+                pending = []
+
+        yield from ReviewerImportService._flush(pending)
+
+    @staticmethod
+    def _flush(pending):
+        while True:
+            try:
+                users = ReviewerImportService.create_reviewers(pending)
+                break
+            except IntegrityError:
+                # Another request registered one of these emails or usernames
+                # after the sheet's prefetch; report those rows and retry the rest
+                conflicts = ReviewerImportService._conflicting_rows(pending)
+                if not conflicts:
+                    raise
+                for entry, errors in conflicts:
+                    yield 'error', {'row': entry['row'], 'email': entry['user'].email, 'errors': errors}
+                conflicted = {id(entry) for entry, _ in conflicts}
+                pending = [entry for entry in pending if id(entry) not in conflicted]
+                for entry in pending:
+                    entry['user'].pk = None
+
+        for entry, user in zip(pending, users):
+            created_row = {
+                'row': entry['row'],
+                'id': user.id,
+                'email': user.email,
+                'username': user.username,
+            }
+            if entry['temporary']:
+                created_row['temporary_password'] = entry['password']
+            yield 'created', created_row
+
+    @staticmethod
+    def _conflicting_rows(pending):
+        """
+        Find pending accounts whose email or username is now registered.
+
+        Args:
+            pending (list): Dicts with an unsaved 'user'
+
+        Returns:
+            list: (entry, errors dict) pairs for the conflicting rows
+        """
+        users = [entry['user'] for entry in pending]
+        taken_emails = set(User.objects.filter(
+            email__in=[user.email for user in users]
+        ).values_list('email', flat=True))
+        taken_usernames = set(User.objects.filter(
+            username__in=[user.username for user in users]
+        ).values_list('username', flat=True))
+
+        conflicts = []
+        for entry in pending:
+            user = entry['user']
+            if user.email in taken_emails:
+                conflicts.append((entry, {'email': ['A user with this email already exists.']}))
+            elif user.username in taken_usernames:
+                conflicts.append((entry, {'username': ['A user with that username already exists.']}))
+        return conflicts
+
+    @staticmethod
+    def create_reviewers(pending):
+        """
+        Persist validated reviewer accounts with bulk INSERTs.
+
+        Password hashing dominates the cost of account creation, so hashes
+        are computed concurrently (the Argon2 binding releases the GIL) and
+        parallelism is applied across accounts rather than inside a hash.
+
+        Args:
+            pending (list): Dicts with an unsaved 'user' and its raw 'password'
+
+        Returns:
+            list: Saved User instances in input order
+        """
+        if not pending:
+            return []
+
+        from reviews.models import ReviewerProfile
+
+        users = [entry['user'] for entry in pending]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            hashes = pool.map(make_password, [entry['password'] for entry in pending])
+            for user, encoded in zip(users, hashes):
+                user.password = encoded
+
+        batch_size = ReviewerImportService.BATCH_SIZE
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=batch_size)
+            # Through rows directly: user_set.add() would first SELECT existing memberships
+            reviewer_group_id = _get_role_group('Reviewer').pk
+            through = User.groups.through
+            through.objects.bulk_create(
+                [through(user_id=user.pk, group_id=reviewer_group_id) for user in users],
+                batch_size=batch_size,
+                ignore_conflicts=True,
+            )
+            ReviewerProfile.objects.bulk_create(
+                [ReviewerProfile(user=user, area_of_expertise='') for user in users],
+                batch_size=batch_size,
+            )
+            # Report only once the accounts are durable
+            count = len(users)
+            transaction.on_commit(lambda: logger.info("Imported %d reviewer accounts", count))
+
+        # bulk_create sends no signals, so listing data is invalidated here
+        invalidate_user_listings()
+        return users
+
+
+class ReviewerApprovalService:
+    """Approval and rejection of pending (inactive) reviewer accounts."""
+
+    NOT_FOUND = 'not_found'
+    NOT_REVIEWER = 'not_reviewer'
+    ALREADY_ACTIVE = 'already_active'
+
+    REJECTION_MESSAGES = {
+        NOT_FOUND: 'User not found.',
+        NOT_REVIEWER: 'User is not a reviewer.',
+        ALREADY_ACTIVE: 'Reviewer is already approved.',
+    }
+
+    @staticmethod
+    def approve(ids):
+        """
+        Activate every pending reviewer among ``ids``.
+
+        Users and their reviewer profiles are activated with one UPDATE each
+        inside a transaction; ids that could not be approved are explained
+        with one further query.
+
+        Args:
+            ids (list): User ids to approve
+
+        Returns:
+            dict: 'approved' (list of ids) and 'rejected' (list of dicts with
+                'id', 'reason' and 'error')
+        """
+        from reviews.models import ReviewerProfile
+
+        ids = list(dict.fromkeys(ids))
+        reviewer_group = _get_role_group('Reviewer')
+
+        with transaction.atomic():
+            approved = list(
+                User.objects.select_for_update(of=('self',))
+                .filter(pk__in=ids, is_active=False, groups=reviewer_group)
+                .values_list('pk', flat=True)
+            )
+            if approved:
+                User.objects.filter(pk__in=approved).update(is_active=True)
+                ReviewerProfile.objects.filter(user_id__in=approved).update(is_active_reviewer=True)
+
+        for pk in approved:
+            invalidate_user_profile(pk)
+        if approved:
+            invalidate_user_listings()
+
+        approved_ids = set(approved)
+        rejected = [
+            {
+                'id': pk,
+                'reason': reason,
+                'error': ReviewerApprovalService.REJECTION_MESSAGES[reason],
+            }
+            for pk, reason in ReviewerApprovalService._refusal_reasons(
+                [pk for pk in ids if pk not in approved_ids], reviewer_group
+            )
+        ]
+
+        if approved:
+            logger.info("Approved %d reviewer accounts", len(approved))
+        return {'approved': approved, 'rejected': rejected}
+
+    @staticmethod
+    def reject(pk):
+        """
+        Delete a pending reviewer registration.
+
+        The reviewer and not-yet-active checks are part of the DELETE's
+        WHERE clause; a refusal is explained with one further query.
+
+        Args:
+            pk (int): User id
+
+        Returns:
+            str or None: None on success, otherwise NOT_FOUND, NOT_REVIEWER
+                or ALREADY_ACTIVE
+        """
+        reviewer_group = _get_role_group('Reviewer')
+        deleted, _ = User.objects.filter(pk=pk, is_active=False, groups=reviewer_group).delete()
+        if deleted:
+            logger.info("Rejected reviewer registration %s", pk)
+            return None
+        return ReviewerApprovalService._refusal_reasons([pk], reviewer_group)[0][1]
+
+    @staticmethod
+    def _refusal_reasons(ids, reviewer_group):
+        """
+        Explain why each of ``ids`` is not a pending reviewer.
+
+        Returns:
+            list: (id, reason) pairs in input order
+        """
+        if not ids:
+            return []
+        found = {
+            user.pk: user
+            for user in User.objects.only('id', 'is_active')
+            .with_group_flag('is_reviewer', reviewer_group)
+            .filter(pk__in=ids)
+        }
+        reasons = []
+        for pk in ids:
+            user = found.get(pk)
+            if user is None:
+                reason = ReviewerApprovalService.NOT_FOUND
+            elif not user.is_reviewer:
+                reason = ReviewerApprovalService.NOT_REVIEWER
+            else:
+                reason = ReviewerApprovalService.ALREADY_ACTIVE
+            reasons.append((pk, reason))
+        return reasons
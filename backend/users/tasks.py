@@ -0,0 +1,105 @@
+"""
+Celery tasks for the users module.
+Runs reviewer spreadsheet imports outside the request cycle.
+"""
+import json
+import logging
+
+from celery import shared_task
+from django.core.files.base import ContentFile
+from django.utils import timezone
+
+from .models import ReviewerImportJob
+from .services import ReviewerImportService, open_xlsx_rows
+
+logger = logging.getLogger(__name__)
+
+UNREADABLE_WORKBOOK_ERROR = 'Unable to read Excel file. Ensure the file is a valid .xlsx workbook.'
+INTERRUPTED_IMPORT_ERROR = (
+    'The import stopped unexpectedly. Accounts listed in the result were created; '
+    'the remaining rows were not imported.'
+)
+
+
+def _read_upload(job):
+    """Open the job's workbook and parse its rows (see parse_rows)."""
+    with job.file.open('rb') as upload:
+        rows, close_workbook = open_xlsx_rows(upload)
+        try:
+            return ReviewerImportService.parse_rows(rows)
+        finally:
+            close_workbook()
+
+
+@shared_task
+def import_reviewers_task(job_id):
+    """
+    Process a queued ReviewerImportJob.
+
+    Progress is saved every ReviewerImportService.BATCH_SIZE rows so the
+    status endpoint can report it while the import runs. Temporary passwords
+    are never written to ``result``; they go to the encrypted ``credentials``
+    file, served once by ReviewerImportCredentialsView.
+    """
+    job = ReviewerImportJob.objects.get(pk=job_id)
+    job.status = ReviewerImportJob.Status.RUNNING
+    job.save(update_fields=['status'])
+
+    created = []
+    errors = []
+    credentials = []
+    parsed = None
+    try:
+        parsed = _read_upload(job)
+    except ValueError as e:
+        job.status = ReviewerImportJob.Status.FAILED
+        job.error = str(e)
+    except Exception:
+        logger.exception("Reviewer import job %s could not read its workbook", job.pk)
+        job.status = ReviewerImportJob.Status.FAILED
+        job.error = UNREADABLE_WORKBOOK_ERROR
+
+    try:
+        if parsed is not None:
+            job.total_rows = len(parsed)
+            job.save(update_fields=['total_rows'])
+
+            for outcome, entry in ReviewerImportService.iter_import(parsed):
+                if outcome == 'created':
+                    password = entry.pop('temporary_password', None)
+                    if password is not None:
+                        credentials.append({
+                            'row': entry['row'],
+                            'email': entry['email'],
+                            'username': entry['username'],
+                            'temporary_password': password,
+                        })
+                    created.append(entry)
+                else:
+                    errors.append(entry)
+                processed = len(created) + len(errors)
+                if processed % ReviewerImportService.BATCH_SIZE == 0:
+                    ReviewerImportJob.objects.filter(pk=job.pk).update(processed_rows=processed)
+
+            job.status = ReviewerImportJob.Status.COMPLETED
+    except Exception:
+        # Rows are saved batch by batch, so ``created`` holds what was committed
+        logger.exception("Reviewer import job %s failed", job.pk)
+        job.status = ReviewerImportJob.Status.FAILED
+        job.error = INTERRUPTED_IMPORT_ERROR
+    finally:
+        # The workbook is no longer needed and may contain passwords
+        job.file.delete(save=False)
+
+    job.processed_rows = len(created) + len(errors)
+    job.result = {
+        'created_count': len(created),
+        'error_count': len(errors),
+        'created': created,
+        'errors': errors,
+    }
+    if credentials:
+        job.credentials.save(f'job-{job.pk}.json', ContentFile(json.dumps(credentials).encode()), save=False)
+    job.finished_at = timezone.now()
+    job.save()
+    return f"Imported {len(created)} reviewers, {len(errors)} errors"
@@ -1,8 +1,47 @@
+import hmac
+import importlib.util
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock, skipUnless
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DatabaseError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from openpyxl import Workbook
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.utils.encoders import JSONEncoder
 
 from reviews.models import ReviewerProfile
-from users.serializers import LoginSerializer, ReviewerRegistrationSerializer, UserCreateSerializer
+from users.authentication import CachedTokenAuthentication
+from users.cache import invalidate_user_profile
+from users.hashers import TunedArgon2PasswordHasher, configure_argon2_from_benchmark
+from users.models import ReviewerImportJob
+from users.serializers import (
+    ChangePasswordSerializer,
+    LoginSerializer,
+    ReviewerRegistrationSerializer,
+    UserCreateSerializer,
+    UserListSerializer,
+    UserSerializer,
+    _get_role_group,
+    clear_role_group_cache,
+    serialize_user,
+)
+from users.services import ReviewerImportService, open_xlsx_rows
+from users.tasks import INTERRUPTED_IMPORT_ERROR, UNREADABLE_WORKBOOK_ERROR, import_reviewers_task
+from users.views import CurrentUserView, LogoutView
 
 
 User = get_user_model()
@@ -29,6 +68,22 @@ class ReviewerRegistrationSerializerTests(TestCase):
         self.assertEqual(profile.area_of_expertise, '')
         self.assertFalse(profile.is_active_reviewer)
 
+    def test_failed_profile_creation_leaves_no_user(self):
+        serializer = ReviewerRegistrationSerializer(data={
+            'username': 'orphan.reviewer',
+            'email': 'orphan.reviewer@nsu.edu',
+            'password': 'StrongPass123!',
+            'first_name': 'Orphan',
+            'last_name': 'Reviewer',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with mock.patch.object(ReviewerProfile.objects, 'create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                serializer.save()
+
+        self.assertFalse(User.objects.filter(username='orphan.reviewer').exists())
+
 
 class LoginSerializerTests(TestCase):
     def test_inactive_user_returns_disabled_error(self):
@@ -47,6 +102,73 @@ class LoginSerializerTests(TestCase):
         self.assertFalse(serializer.is_valid())
         self.assertIn('non_field_errors', serializer.errors)
 
+    def test_email_lookup_is_case_insensitive(self):
+        User.objects.create_user(
+            username='mixed.case',
+            email='mixed.case@nsu.edu',
+            password='StrongPass123!',
+        )
+
+        serializer = LoginSerializer(
+            data={'email': 'Mixed.Case@NSU.edu', 'password': 'StrongPass123!'},
+            context={'request': None},
+        )
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+    def test_exact_email_wins_over_case_variant(self):
+        User.objects.create_user(username='bob.upper', email='Bob@nsu.edu', password='UpperPass123!')
+        lower = User.objects.create_user(username='bob.lower', email='bob@nsu.edu', password='LowerPass123!')
+
+        for email in ('bob@nsu.edu', 'BOB@nsu.edu'):
+            serializer = LoginSerializer(
+                data={'email': email, 'password': 'LowerPass123!'},
+                context={'request': None},
+            )
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+            self.assertEqual(serializer.validated_data['user'].pk, lower.pk)
+
+        serializer = LoginSerializer(
+            data={'email': 'Bob@nsu.edu', 'password': 'LowerPass123!'},
+            context={'request': None},
+        )
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('password', serializer.errors)
+
+    def test_case_variant_login_verifies_password_once(self):
+        User.objects.create_user(username='bob.upper', email='Bob@nsu.edu', password='UpperPass123!')
+        lower = User.objects.create_user(username='bob.lower', email='bob@nsu.edu', password='LowerPass123!')
+        serializer = LoginSerializer(
+            data={'email': 'BOB@nsu.edu', 'password': 'LowerPass123!'},
+            context={'request': None},
+        )
+
+        with mock.patch.object(User, 'check_password', autospec=True, side_effect=User.check_password) as check:
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        self.assertEqual(serializer.validated_data['user'].pk, lower.pk)
+        self.assertEqual([call.args[0].pk for call in check.call_args_list].count(lower.pk), 1)
+
+    def test_valid_login_caches_role_on_user(self):
+        user = User.objects.create_user(
+            username='pi.login',
+            email='pi.login@nsu.edu',
+            password='StrongPass123!',
+        )
+        Group.objects.create(name='PI').user_set.add(user)
+
+        serializer = LoginSerializer(
+            data={'email': 'pi.login@nsu.edu', 'password': 'StrongPass123!'},
+            context={'request': None},
+        )
+
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['role'], 'PI')
+        logged_in = serializer.validated_data['user']
+        with self.assertNumQueries(0):
+            self.assertEqual(UserSerializer(logged_in).data['role'], 'PI')
+
 
 class UserCreateSerializerTests(TestCase):
     def test_create_reviewer_assigns_group_and_profile(self):
@@ -64,3 +186,1062 @@ class UserCreateSerializerTests(TestCase):
 
         self.assertTrue(user.groups.filter(name='Reviewer').exists())
         self.assertTrue(ReviewerProfile.objects.filter(user=user).exists())
+
+    def test_failed_profile_creation_leaves_no_user(self):
+        serializer = UserCreateSerializer(data={
+            'username': 'orphan.created',
+            'email': 'orphan.created@nsu.edu',
+            'password': 'StrongPass123!',
+            'first_name': 'Orphan',
+            'last_name': 'Created',
+            'role': 'Reviewer',
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with mock.patch.object(ReviewerProfile.objects, 'create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                serializer.save()
+
+        self.assertFalse(User.objects.filter(username='orphan.created').exists())
+
+    def test_role_group_is_cached_only_after_commit(self):
+        self.addCleanup(clear_role_group_cache)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            group = _get_role_group('PI')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(_get_role_group('PI'), group)
+
+    def test_duplicate_email_is_rejected_on_save(self):
+        User.objects.create_user(
+            username='existing.user',
+            email='taken@nsu.edu',
+            password='StrongPass123!',
+        )
+        serializer = UserCreateSerializer(data={
+            'username': 'another.user',
+            'email': 'taken@nsu.edu',
+            'password': 'StrongPass123!',
+            'first_name': 'Another',
+            'last_name': 'User',
+            'role': 'PI',
+        })
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(ValidationError) as ctx:
+            serializer.save()
+
+        self.assertIn('email', ctx.exception.detail)
+        self.assertFalse(User.objects.filter(username='another.user').exists())
+
+
+class UserSerializerTests(TestCase):
+    def test_representation_matches_declared_fields(self):
+        user = User.objects.create_user(
+            username='profile.user',
+            email='profile.user@nsu.edu',
+            password='StrongPass123!',
+            first_name='Profile',
+            last_name='User',
+        )
+        Group.objects.create(name='PI').user_set.add(user)
+
+        data = UserSerializer(user).data
+
+        self.assertEqual(list(data.keys()), UserSerializer.Meta.fields)
+        self.assertEqual(data['role'], 'PI')
+        self.assertEqual(data['email'], 'profile.user@nsu.edu')
+
+    def test_serialize_user_matches_serializer_data(self):
+        user = User.objects.create_user(
+            username='shared.user',
+            email='shared.user@nsu.edu',
+            password='StrongPass123!',
+        )
+        Group.objects.create(name='Reviewer').user_set.add(user)
+
+        self.assertEqual(serialize_user(user), UserSerializer(user).data)
+
+
+class ChangePasswordSerializerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='changing.user',
+            email='changing.user@nsu.edu',
+            password='StrongPass123!',
+        )
+
+    def _serializer(self, old_password, new_password):
+        return ChangePasswordSerializer(
+            data={'old_password': old_password, 'new_password': new_password},
+            context={'request': mock.Mock(user=self.user)},
+        )
+
+    def test_reusing_old_password_is_compared_in_constant_time(self):
+        serializer = self._serializer('StrongPass123!', 'StrongPass123!')
+
+        with mock.patch('users.serializers.hmac.compare_digest', wraps=hmac.compare_digest) as compare:
+            self.assertFalse(serializer.is_valid())
+
+        compare.assert_called_once_with(b'StrongPass123!', b'StrongPass123!')
+        self.assertIn('new_password', serializer.errors)
+        self.assertTrue(self._serializer('StrongPass123!', 'EvenStronger456!').is_valid())
+
+    def test_save_updates_only_the_password_column(self):
+        serializer = self._serializer('StrongPass123!', 'EvenStronger456!')
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        with CaptureQueriesContext(connection) as captured:
+            serializer.save()
+
+        updates = [query['sql'] for query in captured if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('SET "password" = ', updates[0])
+        self.assertNotIn('"email"', updates[0])
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('EvenStronger456!'))
+
+
+class UserHasRoleTests(TestCase):
+    def test_resolved_role_answers_without_query(self):
+        user = User.objects.create_user(
+            username='role.user',
+            email='role.user@nsu.edu',
+            password='StrongPass123!',
+        )
+        Group.objects.create(name='PI').user_set.add(user)
+        Group.objects.create(name='Reviewer').user_set.add(user)
+        user = User.objects.with_role().get(pk=user.pk)
+
+        with self.assertNumQueries(0):
+            self.assertTrue(user.has_role('PI'))
+        with self.assertNumQueries(1):
+            self.assertTrue(user.has_role('Reviewer'))
+        self.assertFalse(user.has_role('SRC_Chair'))
+
+    def test_removed_member_loses_dashboard_access_with_cached_token(self):
+        cache.clear()
+        user = User.objects.create_user(
+            username='dash.pi',
+            email='dash.pi@nsu.edu',
+            password='StrongPass123!',
+        )
+        pi_group = Group.objects.create(name='PI')
+        pi_group.user_set.add(user)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+        url = reverse('dashboard-pi')
+        self.assertEqual(client.get(url).status_code, 200)
+
+        pi_group.user_set.remove(user)
+
+        self.assertEqual(client.get(url).status_code, 403)
+
+
+class UserIndexTests(TestCase):
+    def test_pending_user_index_is_partial_on_inactive_users(self):
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(cursor, User._meta.db_table)
+
+        index = constraints['user_inactive_joined_idx']
+        self.assertTrue(index['index'])
+        self.assertEqual(index['columns'], ['date_joined'])
+        self.assertEqual(index['orders'], ['DESC'])
+
+    @skipUnless(connection.vendor == 'sqlite', 'query plan format is SQLite-specific')
+    def test_inactive_newest_first_query_uses_partial_index(self):
+        plan = User.objects.filter(is_active=False).order_by('-date_joined').explain()
+
+        self.assertIn('user_inactive_joined_idx', plan)
+
+
+class UserRegistrationViewTests(TestCase):
+    def test_failed_profile_creation_leaves_no_user(self):
+        admin = User.objects.create_user(
+            username='register.chair',
+            email='register.chair@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        with mock.patch('reviews.models.ReviewerProfile.objects.create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                client.post(reverse('users:register'), {
+                    'username': 'half.created',
+                    'email': 'half.created@nsu.edu',
+                    'password': 'StrongPass123!',
+                    'first_name': 'Half',
+                    'last_name': 'Created',
+                    'role': 'Reviewer',
+                }, format='json')
+
+        self.assertFalse(User.objects.filter(username='half.created').exists())
+
+
+class UserListViewTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username='chair.admin',
+            email='chair.admin@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+        self.reviewer_group = Group.objects.create(name='Reviewer')
+
+    def _create_reviewers(self, count, start=0):
+        for idx in range(start, start + count):
+            user = User.objects.create_user(
+                username=f'reviewer{idx}',
+                email=f'reviewer{idx}@nsu.edu',
+                password='StrongPass123!',
+            )
+            self.reviewer_group.user_set.add(user)
+
+    def _count_list_queries(self):
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('users:user-list'))
+        self.assertEqual(response.status_code, 200)
+        return len(captured), response
+
+    def test_role_lookup_does_not_scale_with_user_count(self):
+        self._create_reviewers(2)
+        small_count, _ = self._count_list_queries()
+
+        self._create_reviewers(5, start=2)
+        large_count, response = self._count_list_queries()
+
+        self.assertEqual(small_count, large_count)
+        roles = {row['email']: row['role'] for row in response.data['results']}
+        self.assertEqual(roles['reviewer0@nsu.edu'], 'Reviewer')
+        self.assertIsNone(roles['chair.admin@nsu.edu'])
+
+    def test_role_listings_do_not_create_missing_groups(self):
+        self.addCleanup(clear_role_group_cache)
+        self.reviewer_group.delete()
+
+        list_response = self.client.get(reverse('users:user-list'), {'role': 'PI'})
+        pending_response = self.client.get(reverse('users:pending-reviewers'))
+
+        self.assertEqual(list_response.status_code, 200)
+        self.assertEqual(list_response.data['results'], [])
+        self.assertEqual(pending_response.status_code, 200)
+        self.assertEqual(pending_response.data['results'], [])
+        self.assertFalse(Group.objects.filter(name__in=['PI', 'Reviewer']).exists())
+
+    def test_list_requires_staff_user(self):
+        non_staff = User.objects.create_user(
+            username='plain.user',
+            email='plain.user@nsu.edu',
+            password='StrongPass123!',
+        )
+        client = APIClient()
+        self.assertEqual(client.get(reverse('users:user-list')).status_code, 401)
+
+        client.force_authenticate(non_staff)
+        self.assertEqual(client.get(reverse('users:user-list')).status_code, 403)
+
+    def test_page_count_is_cached_until_users_change(self):
+        self._create_reviewers(2)
+        first_count, first = self._count_list_queries()
+        repeat_count, repeat = self._count_list_queries()
+
+        self.assertEqual(repeat_count, first_count - 1)
+        self.assertEqual(repeat.data['count'], first.data['count'])
+
+        self._create_reviewers(1, start=2)
+        _, response = self._count_list_queries()
+        self.assertEqual(response.data['count'], first.data['count'] + 1)
+
+    def test_unchanged_listing_returns_not_modified_without_queries(self):
+        self._create_reviewers(2)
+        url = reverse('users:user-list')
+        etag = self.client.get(url)['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.assertNotEqual(self.client.get(url, {'role': 'Reviewer'})['ETag'], etag)
+
+        self._create_reviewers(1, start=2)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 4)
+
+    def test_role_filter_is_paginated(self):
+        self._create_reviewers(3)
+
+        response = self.client.get(reverse('users:user-list'), {'role': 'Reviewer'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual({row['role'] for row in response.data['results']}, {'Reviewer'})
+
+    def test_page_size_is_client_selectable_and_capped(self):
+        self._create_reviewers(3)
+        url = reverse('users:user-list')
+
+        self.assertEqual(len(self.client.get(url, {'page_size': 2}).data['results']), 2)
+        with mock.patch('users.pagination.UserPagination.max_page_size', 3):
+            self.assertEqual(len(self.client.get(url, {'page_size': 10}).data['results']), 3)
+
+    def test_role_filter_matches_group_members_only(self):
+        self._create_reviewers(2)
+        pi = User.objects.create_user(
+            username='list.pi',
+            email='list.pi@nsu.edu',
+            password='StrongPass123!',
+        )
+        Group.objects.create(name='PI').user_set.add(pi)
+
+        response = self.client.get(reverse('users:user-list'), {'role': 'PI'})
+        self.assertEqual([row['email'] for row in response.data['results']], ['list.pi@nsu.edu'])
+
+        response = self.client.get(reverse('users:user-list'), {'role': 'Unknown'})
+        self.assertEqual(response.data['count'], 0)
+        self.assertFalse(Group.objects.filter(name='Unknown').exists())
+
+    def test_is_active_filter_ignores_unrecognised_values(self):
+        User.objects.create_user(
+            username='inactive.listed',
+            email='inactive.listed@nsu.edu',
+            password='StrongPass123!',
+            is_active=False,
+        )
+        url = reverse('users:user-list')
+
+        self.assertEqual(self.client.get(url, {'is_active': 'false'}).data['count'], 1)
+        self.assertEqual(self.client.get(url, {'is_active': '1'}).data['count'], 1)
+        self.assertEqual(self.client.get(url, {'is_active': 'maybe'}).data['count'], 2)
+
+    def test_full_name_falls_back_to_email(self):
+        User.objects.create_user(
+            username='named.user',
+            email='named.user@nsu.edu',
+            password='StrongPass123!',
+            first_name='Named',
+            last_name='User',
+        )
+
+        _, response = self._count_list_queries()
+
+        names = {row['email']: row['full_name'] for row in response.data['results']}
+        self.assertEqual(names['named.user@nsu.edu'], 'Named User')
+        self.assertEqual(names['chair.admin@nsu.edu'], 'chair.admin@nsu.edu')
+
+    def test_rows_match_list_serializer(self):
+        self._create_reviewers(2)
+
+        _, response = self._count_list_queries()
+
+        queryset = User.objects.with_role().with_full_name().order_by('-date_joined')
+        expected = UserListSerializer(queryset, many=True).data
+        self.assertEqual(
+            json.loads(json.dumps(response.data['results'], cls=JSONEncoder)),
+            json.loads(json.dumps(expected, cls=JSONEncoder)),
+        )
+
+    def test_response_body_matches_drf_json_encoding(self):
+        self._create_reviewers(2)
+
+        _, response = self._count_list_queries()
+
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(
+            json.loads(response.content),
+            json.loads(JSONRenderer().render(response.data)),
+        )
+
+
+class UserDetailViewTests(TestCase):
+    def test_detail_resolves_role_in_the_user_query(self):
+        admin = User.objects.create_user(
+            username='detail.chair',
+            email='detail.chair@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        Group.objects.create(name='SRC_Chair').user_set.add(admin)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        with self.assertNumQueries(1):
+            response = client.get(reverse('users:user-detail', args=[admin.pk]))
+
+        self.assertEqual(response.data['role'], 'SRC_Chair')
+
+    def test_update_keeps_deferred_password(self):
+        admin = User.objects.create_user(
+            username='detail.editor',
+            email='detail.editor@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        response = client.patch(
+            reverse('users:user-detail', args=[admin.pk]), {'first_name': 'Edited'}, format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        admin.refresh_from_db()
+        self.assertEqual(admin.first_name, 'Edited')
+        self.assertTrue(admin.check_password('StrongPass123!'))
+
+
+class CurrentUserViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='current.user',
+            email='current.user@nsu.edu',
+            password='StrongPass123!',
+            first_name='Current',
+            last_name='User',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_permission_instances_are_shared_per_view_class(self):
+        permissions = CurrentUserView().get_permissions()
+
+        self.assertIs(CurrentUserView().get_permissions(), permissions)
+        self.assertIsNot(LogoutView().get_permissions(), permissions)
+        self.assertEqual(APIClient().get(reverse('users:current-user')).status_code, 401)
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 200)
+
+    def test_profile_is_served_from_cache_until_invalidated(self):
+        url = reverse('users:current-user')
+        self.assertEqual(self.client.get(url).data['first_name'], 'Current')
+
+        User.objects.filter(pk=self.user.pk).update(first_name='Renamed')
+        self.user.first_name = 'Renamed'
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).data['first_name'], 'Current')
+
+        invalidate_user_profile(self.user.pk)
+        self.assertEqual(self.client.get(url).data['first_name'], 'Renamed')
+
+    def test_model_and_group_changes_refresh_profile_and_etag(self):
+        url = reverse('users:current-user')
+        self.client.force_authenticate(None)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+        etag = self.client.get(url)['ETag']
+
+        user = User.objects.get(pk=self.user.pk)
+        user.first_name = 'Renamed'
+        user.save()
+        Group.objects.create(name='PI').user_set.add(user)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['first_name'], 'Renamed')
+        self.assertEqual(response.data['role'], 'PI')
+
+    def test_login_primes_profile_cache(self):
+        login = APIClient().post(
+            reverse('users:login'),
+            {'email': 'current.user@nsu.edu', 'password': 'StrongPass123!'},
+            format='json',
+        )
+        self.assertEqual(login.status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('users:current-user'))
+        self.assertEqual(response.data, login.data['user'])
+
+    def test_admin_edit_after_login_replaces_primed_profile(self):
+        login = APIClient().post(
+            reverse('users:login'),
+            {'email': 'current.user@nsu.edu', 'password': 'StrongPass123!'},
+            format='json',
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Token {login.data['access']}")
+
+        user = User.objects.get(pk=self.user.pk)
+        user.last_name = 'Edited'
+        user.save()
+
+        self.assertEqual(client.get(reverse('users:current-user')).data['last_name'], 'Edited')
+
+    def test_matching_etag_returns_not_modified(self):
+        url = reverse('users:current-user')
+        etag = self.client.get(url)['ETag']
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+        invalidate_user_profile(self.user.pk)
+        self.user.first_name = 'Renamed'
+        User.objects.filter(pk=self.user.pk).update(first_name='Renamed')
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class UserAdminTests(TestCase):
+    def setUp(self):
+        self.superuser = User.objects.create_superuser(
+            username='site.admin',
+            email='site.admin@nsu.edu',
+            password='StrongPass123!',
+        )
+        self.client.force_login(self.superuser)
+        self.reviewer_group = Group.objects.create(name='Reviewer')
+
+    def _changelist_queries(self, count, start=0):
+        for idx in range(start, start + count):
+            user = User.objects.create_user(
+                username=f'listed{idx}',
+                email=f'listed{idx}@nsu.edu',
+                password='StrongPass123!',
+            )
+            self.reviewer_group.user_set.add(user)
+        with CaptureQueriesContext(connection) as captured:
+            response = self.client.get(reverse('admin:users_user_changelist'))
+        self.assertEqual(response.status_code, 200)
+        return len(captured), response
+
+    def test_roles_column_does_not_query_per_row(self):
+        small_count, _ = self._changelist_queries(2)
+        large_count, response = self._changelist_queries(5, start=2)
+
+        self.assertEqual(small_count, large_count)
+        self.assertContains(response, '<td class="field-get_roles">Reviewer</td>', count=7, html=True)
+
+
+class Argon2TuningTests(TestCase):
+    def setUp(self):
+        defaults = {
+            name: getattr(TunedArgon2PasswordHasher, name)
+            for name in ('time_cost', 'memory_cost', 'parallelism')
+        }
+        self.addCleanup(lambda: [setattr(TunedArgon2PasswordHasher, k, v) for k, v in defaults.items()])
+
+    def test_cached_parameters_are_applied_without_benchmarking(self):
+        params = {'time_cost': 2, 'memory_cost': 19 * 1024, 'parallelism': 1}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'argon2.json')
+            with open(path, 'w') as fh:
+                json.dump({'target_ms': 250, 'params': params}, fh)
+
+            configure_argon2_from_benchmark(250, path)
+
+        self.assertEqual(TunedArgon2PasswordHasher.time_cost, 2)
+        self.assertEqual(TunedArgon2PasswordHasher.memory_cost, 19 * 1024)
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='token.user',
+            email='token.user@nsu.edu',
+            password='StrongPass123!',
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+    def test_cached_token_skips_database(self):
+        url = reverse('users:current-user')
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data['email'], 'token.user@nsu.edu')
+
+    def test_cache_miss_resolves_user_and_role_in_one_query(self):
+        Group.objects.create(name='PI').user_set.add(self.user)
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+
+        with self.assertNumQueries(1):
+            user, token = CachedTokenAuthentication().authenticate(request)
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(token.key, self.token.key)
+        self.assertIn('password', user.get_deferred_fields())
+        self.assertEqual(UserSerializer(user).data['role'], 'PI')
+
+    def test_logout_revokes_cached_token(self):
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 200)
+
+        self.assertEqual(self.client.post(reverse('users:logout')).status_code, 200)
+
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 401)
+
+    def test_logout_with_cached_token_deletes_without_user_lookup(self):
+        self.client.get(reverse('users:current-user'))
+
+        # SELECT + DELETE: the Token post_delete receiver rules out a fast delete
+        with self.assertNumQueries(2):
+            response = self.client.post(reverse('users:logout'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Token.objects.filter(user=self.user).exists())
+
+    def test_logout_without_token_succeeds(self):
+        self.token.delete()
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        self.assertEqual(client.post(reverse('users:logout')).status_code, 200)
+
+    def _assert_cached(self, url=None):
+        response = self.client.get(url or reverse('users:current-user'))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_deactivating_user_revokes_cached_token(self):
+        self._assert_cached()
+
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 401)
+
+    def test_deleting_token_revokes_cached_token(self):
+        self._assert_cached()
+
+        Token.objects.filter(pk=self.token.pk).delete()
+
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 401)
+
+    def test_deleting_user_revokes_cached_token(self):
+        self._assert_cached()
+
+        self.user.delete()
+
+        self.assertEqual(self.client.get(reverse('users:current-user')).status_code, 401)
+
+    def test_revoking_staff_takes_effect_immediately(self):
+        self.user.is_staff = True
+        self.user.save()
+        self._assert_cached(reverse('users:user-list'))
+
+        self.user.is_staff = False
+        self.user.save()
+
+        self.assertEqual(self.client.get(reverse('users:user-list')).status_code, 403)
+
+    def test_group_changes_refresh_cached_role(self):
+        reviewer = Group.objects.create(name='Reviewer')
+        self.user.groups.add(reviewer)
+        self.assertEqual(self._assert_cached().data['role'], 'Reviewer')
+
+        reviewer.user_set.clear()
+        request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        user, _ = CachedTokenAuthentication().authenticate(request)
+        self.assertIsNone(user._cached_role)
+
+    def test_password_change_loads_deferred_hash(self):
+        self.client.get(reverse('users:current-user'))
+
+        response = self.client.post(reverse('users:change-password'), {
+            'old_password': 'StrongPass123!',
+            'new_password': 'EvenStronger456!',
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password('EvenStronger456!'))
+
+
+class ReviewerApprovalViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.admin = User.objects.create_user(
+            username='approving.chair',
+            email='approving.chair@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+        serializer = ReviewerRegistrationSerializer(data={
+            'username': 'pending.reviewer',
+            'email': 'pending.reviewer@nsu.edu',
+            'password': 'StrongPass123!',
+            'first_name': 'Pending',
+            'last_name': 'Reviewer',
+        })
+        serializer.is_valid(raise_exception=True)
+        self.pending = serializer.save()
+
+    def test_approve_activates_user_and_profile(self):
+        response = self.client.post(reverse('users:approve-reviewer', args=[self.pending.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.pending.refresh_from_db()
+        self.assertEqual(response.data['user'], UserSerializer(self.pending).data)
+        self.assertTrue(self.pending.is_active)
+        self.assertTrue(ReviewerProfile.objects.get(user=self.pending).is_active_reviewer)
+
+    def test_approve_twice_is_refused(self):
+        url = reverse('users:approve-reviewer', args=[self.pending.pk])
+        self.client.post(url)
+
+        response = self.client.post(url)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['error'], 'Reviewer is already approved.')
+
+    def test_approve_unknown_user_returns_404(self):
+        response = self.client.post(reverse('users:approve-reviewer', args=[999999]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_bulk_approve_reports_each_id(self):
+        response = self.client.post(
+            reverse('users:approve-reviewers'),
+            {'ids': [self.pending.pk, self.admin.pk, 999999]},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['approved'], [self.pending.pk])
+        reasons = {row['id']: row['reason'] for row in response.data['rejected']}
+        self.assertEqual(reasons, {self.admin.pk: 'not_reviewer', 999999: 'not_found'})
+        self.assertTrue(ReviewerProfile.objects.get(user=self.pending).is_active_reviewer)
+
+    def test_bulk_approve_requires_ids(self):
+        response = self.client.post(reverse('users:approve-reviewers'), {'ids': []}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_approve_rejects_non_reviewer(self):
+        response = self.client.post(reverse('users:approve-reviewer', args=[self.admin.pk]))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_pending_list_renders_without_deferred_loads(self):
+        # Warm the per-process role group cache as a committed lookup would
+        self.addCleanup(clear_role_group_cache)
+        with self.captureOnCommitCallbacks(execute=True):
+            _get_role_group('Reviewer')
+
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('users:pending-reviewers'))
+
+        self.assertEqual(response.status_code, 200)
+        row = response.data['results'][0]
+        self.assertEqual(row['full_name'], 'Pending Reviewer')
+        self.assertEqual(row['role'], 'Reviewer')
+
+    def test_reject_deletes_pending_reviewer(self):
+        response = self.client.delete(reverse('users:reject-reviewer', args=[self.pending.pk]))
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(User.objects.filter(pk=self.pending.pk).exists())
+        self.assertFalse(ReviewerProfile.objects.filter(user_id=self.pending.pk).exists())
+
+    def test_reject_refuses_active_reviewer(self):
+        self.client.post(reverse('users:approve-reviewer', args=[self.pending.pk]))
+
+        response = self.client.delete(reverse('users:reject-reviewer', args=[self.pending.pk]))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(User.objects.filter(pk=self.pending.pk).exists())
+
+
+class ReviewerImportServiceTests(TestCase):
+    HEADER = ('First Name', 'Last Name', 'Email', 'Password')
+
+    def test_import_creates_reviewers_in_bulk(self):
+        rows = [
+            self.HEADER,
+            ('Ada', 'Lovelace', 'ada@nsu.edu', None),
+            ('Alan', 'Turing', 'alan@nsu.edu', 'StrongPass123!'),
+            ('Ada', 'Again', 'ada@nsu.edu', None),
+        ]
+
+        result = ReviewerImportService.import_rows(rows)
+
+        self.assertEqual(result['created_count'], 2)
+        self.assertEqual(result['errors'][0]['row'], 4)
+        self.assertIn('temporary_password', result['created'][0])
+        self.assertNotIn('temporary_password', result['created'][1])
+        alan = User.objects.get(email='alan@nsu.edu')
+        self.assertTrue(alan.check_password('StrongPass123!'))
+        self.assertTrue(alan.groups.filter(name='Reviewer').exists())
+        self.assertTrue(ReviewerProfile.objects.filter(user=alan).exists())
+
+    def test_reviewer_memberships_are_inserted_without_lookup(self):
+        rows = [self.HEADER] + [(f'First{idx}', 'Last', f'member{idx}@nsu.edu', None) for idx in range(3)]
+        membership_table = User.groups.through._meta.db_table
+
+        with CaptureQueriesContext(connection) as captured:
+            result = ReviewerImportService.import_rows(rows)
+
+        membership_queries = [query['sql'] for query in captured if membership_table in query['sql']]
+        self.assertEqual(len(membership_queries), 1)
+        self.assertTrue(membership_queries[0].startswith('INSERT'))
+        self.assertEqual(result['created_count'], 3)
+        self.assertEqual(User.objects.filter(groups__name='Reviewer').count(), 3)
+
+    def test_email_registered_after_prefetch_is_reported_per_row(self):
+        create_reviewers = ReviewerImportService.create_reviewers
+
+        def register_then_create(pending):
+            if not User.objects.filter(email='late@nsu.edu').exists():
+                User.objects.create_user(username='late.comer', email='late@nsu.edu', password='StrongPass123!')
+            return create_reviewers(pending)
+
+        rows = [
+            self.HEADER,
+            ('Ada', 'Lovelace', 'ada@nsu.edu', None),
+            ('Late', 'Comer', 'late@nsu.edu', None),
+        ]
+        with mock.patch.object(ReviewerImportService, 'create_reviewers', side_effect=register_then_create):
+            result = ReviewerImportService.import_rows(rows)
+
+        self.assertEqual(result['created_count'], 1)
+        self.assertEqual(result['created'][0]['email'], 'ada@nsu.edu')
+        self.assertEqual(result['errors'], [{
+            'row': 3,
+            'email': 'late@nsu.edu',
+            'errors': {'email': ['A user with this email already exists.']},
+        }])
+        self.assertTrue(User.objects.get(email='ada@nsu.edu').groups.filter(name='Reviewer').exists())
+
+    def test_existing_email_is_reported(self):
+        User.objects.create_user(username='taken', email='taken@nsu.edu', password='StrongPass123!')
+
+        result = ReviewerImportService.import_rows([self.HEADER, ('T', 'Aken', 'taken@nsu.edu', None)])
+
+        self.assertEqual(result['created_count'], 0)
+        self.assertIn('email', result['errors'][0]['errors'])
+
+    def test_existing_username_is_reported(self):
+        User.objects.create_user(username='taken', email='first@nsu.edu', password='StrongPass123!')
+
+        result = ReviewerImportService.import_rows([
+            ('First Name', 'Last Name', 'Email', 'Username'),
+            ('T', 'Aken', 'second@nsu.edu', 'taken'),
+        ])
+
+        self.assertEqual(result['created_count'], 0)
+        self.assertIn('username', result['errors'][0]['errors'])
+
+    def test_generated_usernames_skip_taken_names(self):
+        User.objects.create_user(username='ada', email='ada@old.edu', password='StrongPass123!')
+        User.objects.create_user(username='ada1', email='ada1@old.edu', password='StrongPass123!')
+
+        result = ReviewerImportService.import_rows([
+            ('First Name', 'Last Name', 'Email'),
+            ('Ada', 'One', 'ada@nsu.edu'),
+            ('Ada', 'Two', 'ada@bracu.edu'),
+        ])
+
+        usernames = [row['username'] for row in result['created']]
+        self.assertEqual(usernames, ['ada2', 'ada3'])
+
+    def test_header_aliases_map_to_fields_first_column_wins(self):
+        parsed = ReviewerImportService.parse_rows([
+            ('Firstname', 'Last', 'Email Address', 'Mail', 'User Name', 'Temp Password'),
+            ('Ada', 'Lovelace', 'ada@nsu.edu', 'other@nsu.edu', 'ada.l', 'StrongPass123!'),
+        ])
+
+        self.assertEqual(parsed, [(2, {
+            'first_name': 'Ada',
+            'last_name': 'Lovelace',
+            'email': 'ada@nsu.edu',
+            'username': 'ada.l',
+            'password': 'StrongPass123!',
+        })])
+
+    def test_missing_columns_raise(self):
+        with self.assertRaises(ValueError):
+            ReviewerImportService.import_rows([('Email',), ('x@nsu.edu',)])
+
+
+def _workbook_file(rows):
+    """Build an uploaded .xlsx file whose first sheet holds ``rows``."""
+    workbook = Workbook()
+    for row in rows:
+        workbook.active.append(row)
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return SimpleUploadedFile('reviewers.xlsx', buffer.getvalue())
+
+
+class OpenXlsxRowsTests(TestCase):
+    def _read(self, upload):
+        rows, close = open_xlsx_rows(upload)
+        try:
+            return [tuple(row) for row in rows]
+        finally:
+            close()
+
+    @skipUnless(importlib.util.find_spec('python_calamine'), 'python-calamine is not installed')
+    def test_calamine_rows_match_openpyxl_values(self):
+        rows = [
+            ('first_name', 'last_name', 'email', 'username'),
+            ('Grace', None, 'grace@nsu.edu', 87654321),
+            ('Ada', 'Lovelace', 'ada@nsu.edu', 1.5),
+        ]
+
+        calamine_rows = self._read(_workbook_file(rows))
+        with mock.patch.dict(sys.modules, {'python_calamine': None}):
+            openpyxl_rows = self._read(_workbook_file(rows))
+
+        self.assertEqual(calamine_rows, rows)
+        self.assertEqual(calamine_rows, openpyxl_rows)
+        self.assertIsInstance(calamine_rows[1][3], int)
+
+
+class ImportReviewersFromExcelViewTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create_user(
+            username='import.chair',
+            email='import.chair@nsu.edu',
+            password='StrongPass123!',
+            is_staff=True,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def _upload(self, rows, **extra):
+        upload = _workbook_file(rows)
+        return self.client.post(reverse('users:import-reviewers'), {'file': upload}, format='multipart', **extra)
+
+    def test_import_creates_reviewers_from_workbook(self):
+        response = self._upload([
+            ('first_name', 'last_name', 'email'),
+            ('Grace', 'Hopper', 'grace@nsu.edu'),
+        ])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created_count'], 1)
+        self.assertTrue(User.objects.filter(email='grace@nsu.edu', groups__name='Reviewer').exists())
+
+    def test_ndjson_accept_streams_row_outcomes(self):
+        response = self._upload([
+            ('first_name', 'last_name', 'email'),
+            ('Grace', 'Hopper', 'grace@nsu.edu'),
+            ('Bad', 'Email', 'not-an-email'),
+        ], HTTP_ACCEPT='application/x-ndjson')
+
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([line['status'] for line in lines], ['error', 'created', 'done'])
+        self.assertEqual(lines[-1]['created_count'], 1)
+
+    def test_background_import_is_queued_and_pollable(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with self.settings(MEDIA_ROOT=media_root), \
+                mock.patch('users.views.import_reviewers_task.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse('users:import-reviewers') + '?background=true',
+                    {'file': _workbook_file([
+                        ('first_name', 'last_name', 'email'),
+                        ('Grace', 'Hopper', 'grace@nsu.edu'),
+                    ])},
+                    format='multipart',
+                )
+            self.assertEqual(response.status_code, 202)
+            job_id = response.data['job_id']
+            delay.assert_called_once_with(job_id)
+
+            import_reviewers_task(job_id)
+
+            status_response = self.client.get(response.data['status_url'])
+            self.assertEqual(status_response.data['status'], 'COMPLETED')
+            self.assertEqual(status_response.data['result']['created_count'], 1)
+            self.assertNotIn('temporary_password', status_response.data['result']['created'][0])
+            self.assertNotIn('Rvwr!', json.dumps(ReviewerImportJob.objects.get(pk=job_id).result))
+            self.assertFalse(ReviewerImportJob.objects.get(pk=job_id).file)
+
+            credentials_response = self.client.get(status_response.data['credentials_url'])
+            self.assertEqual(credentials_response.status_code, 200)
+            grace = User.objects.get(email='grace@nsu.edu')
+            self.assertTrue(grace.check_password(credentials_response.data['credentials'][0]['temporary_password']))
+
+            self.assertEqual(self.client.get(status_response.data['credentials_url']).status_code, 404)
+            self.assertIsNone(self.client.get(response.data['status_url']).data['credentials_url'])
+
+    def test_background_import_fails_job_when_broker_is_down(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        with self.settings(MEDIA_ROOT=media_root), \
+                mock.patch('users.views.import_reviewers_task.delay', side_effect=ConnectionError):
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse('users:import-reviewers') + '?background=true',
+                    {'file': _workbook_file([
+                        ('first_name', 'last_name', 'email'),
+                        ('Grace', 'Hopper', 'grace@nsu.edu'),
+                    ])},
+                    format='multipart',
+                )
+
+        self.assertEqual(response.status_code, 202)
+        job = ReviewerImportJob.objects.get(pk=response.data['job_id'])
+        self.assertEqual(job.status, 'FAILED')
+        self.assertTrue(job.error)
+        self.assertIsNotNone(job.finished_at)
+        self.assertFalse(job.file)
+        self.assertEqual(os.listdir(os.path.join(media_root, 'reviewer_imports')), [])
+
+    def _queued_job(self, upload):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = self.settings(MEDIA_ROOT=media_root)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        return ReviewerImportJob.objects.create(file=upload)
+
+    def test_background_job_reports_unreadable_workbook(self):
+        job = self._queued_job(SimpleUploadedFile('reviewers.xlsx', b'not a workbook'))
+
+        import_reviewers_task(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'FAILED')
+        self.assertEqual(job.error, UNREADABLE_WORKBOOK_ERROR)
+        self.assertFalse(job.file)
+
+    def test_background_job_failing_mid_import_keeps_created_rows(self):
+        job = self._queued_job(_workbook_file([
+            ('first_name', 'last_name', 'email'),
+            ('Grace', 'Hopper', 'grace@nsu.edu'),
+            ('Ada', 'Lovelace', 'ada@nsu.edu'),
+        ]))
+        create_reviewers = ReviewerImportService.create_reviewers
+        calls = []
+
+        def fail_second_batch(pending):
+            calls.append(pending)
+            if len(calls) > 1:
+                raise DatabaseError('connection lost')
+            return create_reviewers(pending)
+
+        with mock.patch.object(ReviewerImportService, 'BATCH_SIZE', 1), \
+                mock.patch.object(ReviewerImportService, 'create_reviewers', side_effect=fail_second_batch):
+            import_reviewers_task(job.pk)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'FAILED')
+        self.assertEqual(job.error, INTERRUPTED_IMPORT_ERROR)
+        self.assertEqual(job.result['created_count'], 1)
+        self.assertEqual(job.result['created'][0]['email'], 'grace@nsu.edu')
+        self.assertTrue(User.objects.filter(email='grace@nsu.edu').exists())
+        self.assertFalse(job.file)
+
+    def test_missing_columns_return_400(self):
+        response = self._upload([('email',), ('grace@nsu.edu',)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('first_name', response.data['error'])
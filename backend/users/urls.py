@@ -28,9 +28,12 @@ from .views import (
     UserListView,
     UserDetailView,
     ImportReviewersFromExcelView,
+    ReviewerImportJobView,
+    ReviewerImportCredentialsView,
     ReviewerPublicRegistrationView,
     PendingReviewersView,
     ApproveReviewerView,
+    ApproveReviewersBulkView,
     RejectReviewerView
 )
 
@@ -55,6 +58,12 @@ urlpatterns = [
     path('import-reviewers/', ImportReviewersFromExcelView.as_view(), name='import-reviewers'),
     # Bulk import reviewer accounts from Excel (.xlsx) (admin only)
 
+    path('import-reviewers/<int:pk>/', ReviewerImportJobView.as_view(), name='import-reviewers-job'),
+    # Poll a background reviewer import (admin only)
+
+    path('import-reviewers/<int:pk>/credentials/', ReviewerImportCredentialsView.as_view(), name='import-reviewers-credentials'),
+    # One-time download of a background import's temporary passwords (admin only)
+
     path('register-reviewer/', ReviewerPublicRegistrationView.as_view(), name='register-reviewer'),
     # Public reviewer self-registration (no authentication required)
 
@@ -73,6 +82,9 @@ urlpatterns = [
     path('approve-reviewer/<int:pk>/', ApproveReviewerView.as_view(), name='approve-reviewer'),
     # Approve a pending reviewer registration (admin only)
 
+    path('approve-reviewers/', ApproveReviewersBulkView.as_view(), name='approve-reviewers'),
+    # Approve several pending reviewer registrations at once (admin only)
+
     path('reject-reviewer/<int:pk>/', RejectReviewerView.as_view(), name='reject-reviewer'),
     # Reject a pending reviewer registration (admin only)
 ]
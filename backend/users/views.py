@@ -16,44 +16,119 @@ Views:
 Authentication Method: Token-based (DRF AuthToken)
 """
 
-from rest_framework import status, generics, permissions
+import hashlib
+import json
+import logging
+
+from rest_framework import status, generics, permissions, serializers
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 from rest_framework.authtoken.views import ObtainAuthToken
+from rest_framework.renderers import BrowsableAPIRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
 from django.contrib.auth import get_user_model
-from django.utils.crypto import get_random_string
+from django.core.cache import cache
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import quote_etag
 
+from .authentication import invalidate_token, invalidate_user_tokens
+from .cache import (
+    USER_PROFILE_CACHE_TIMEOUT,
+    invalidate_user_profile,
+    user_listing_version,
+    user_profile_cache_key,
+)
+
+from .models import ReviewerImportJob, UserQuerySet
+from .pagination import CachedCountPagination, UserPagination
+from .renderers import NDJSONRenderer, ORJSONRenderer
 from .serializers import (
     UserSerializer,
     LoginSerializer,
     UserCreateSerializer,
     ChangePasswordSerializer,
     UserListSerializer,
-    ReviewerRegistrationSerializer
+    ReviewerRegistrationSerializer,
+    ReviewerBulkApprovalSerializer,
+    ReviewerImportJobSerializer,
+    _find_role_group,
+    serialize_user,
 )
+from .services import ReviewerApprovalService, ReviewerImportService, open_xlsx_rows
+from .tasks import import_reviewers_task
 
 # Get the custom User model
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
 
-def _normalize_header(value):
-    return str(value).strip().lower().replace(' ', '_') if value is not None else ''
+# Keys of a UserSerializer profile, for views that build it from values()
+USER_PROFILE_FIELDS = ('id', 'username', 'email', 'first_name', 'last_name', 'role', 'is_active', 'is_staff')
+# Model columns behind those keys (role is an SQL annotation)
+USER_PROFILE_COLUMNS = ('id', 'username', 'email', 'first_name', 'last_name', 'is_active', 'is_staff')
 
+# Keys of each user listing row; mirrors UserListSerializer.Meta.fields
+USER_LIST_FIELDS = ('id', 'username', 'email', 'full_name', 'role', 'is_active', 'date_joined')
+# Model columns behind those keys (full_name and role are SQL annotations)
+USER_LIST_COLUMNS = ('id', 'username', 'email', 'is_active', 'date_joined')
+
+# Accepted spellings of the is_active query parameter; anything else is ignored
+_BOOL_MAP = {
+    'true': True, '1': True, 'yes': True, 't': True,
+    'false': False, '0': False, 'no': False, 'f': False,
+}
 
-def _generate_unique_username(email):
-    base = email.split('@')[0].strip().lower().replace(' ', '.') or 'reviewer'
-    candidate = base
-    suffix = 1
-    while User.objects.filter(username=candidate).exists():
-        candidate = f"{base}{suffix}"
-        suffix += 1
-    return candidate
 
+class IsAdminAuthenticated(permissions.BasePermission):
+    """Allow access only to authenticated staff users, in a single check."""
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and user.is_staff)
 
-def _generate_temp_password():
-    # Meets minimum length and avoids common-password/numeric-only failures.
-    return f"Rvwr!{get_random_string(10)}"
+
+class SharedPermissionsMixin:
+    """
+    Build a view's permission instances once per class instead of per request.
+
+    Only for views whose permission classes are stateless and not overridden
+    per instance.
+    """
+
+    def get_permissions(self):
+        cls = type(self)
+        shared = cls.__dict__.get('_shared_permissions')
+        if shared is None:
+            shared = cls._shared_permissions = tuple(permission() for permission in self.permission_classes)
+        return shared
+
+
+def _etag(*parts):
+    """Return a quoted ETag digesting ``parts``."""
+    digest = hashlib.md5(':'.join(map(str, parts)).encode(), usedforsecurity=False)
+    return quote_etag(digest.hexdigest())
+
+
+def _conditional_response(request, etag, build_response):
+    """
+    Answer 304 Not Modified when If-None-Match matches ``etag``, otherwise
+    return ``build_response()`` tagged with it.
+
+    Responses are per-user: clients must revalidate, and shared caches must
+    not reuse them across tokens.
+    """
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = build_response()
+        response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ('Authorization',))
+    return response
 
 
 class LoginView(ObtainAuthToken):
@@ -114,29 +189,29 @@ class LoginView(ObtainAuthToken):
         )
         serializer.is_valid(raise_exception=True)
 
-        # Get authenticated user from serializer validation
+        # Get authenticated user and role from serializer validation
         user = serializer.validated_data['user']
+        role = serializer.validated_data['role']
 
         # Get or create authentication token for this user
         token, created = Token.objects.get_or_create(user=user)
 
-        # Determine user's role from group membership
-        role = None
-        if user.groups.exists():
-            role = user.groups.first().name
-
-        # Serialize user data for response
-        user_serializer = UserSerializer(user)
+        # Build the profile dict from the instance already in hand; the
+        # frontend stores it as-is, so the shape matches UserSerializer
+        user_data = serialize_user(user)
+        # Prime the profile cache read by CurrentUserView on app boot; later
+        # saves and group changes drop it via the users.cache signal receivers
+        cache.set(user_profile_cache_key(user.pk), user_data, USER_PROFILE_CACHE_TIMEOUT)
 
         # Return token, role, and user details
         return Response({
             'access': token.key,  # Named 'access' for frontend compatibility
             'role': role,
-            'user': user_serializer.data
+            'user': user_data
         }, status=status.HTTP_200_OK)
 
 
-class LogoutView(APIView):
+class LogoutView(SharedPermissionsMixin, APIView):
     """
     User logout endpoint that destroys the authentication token.
 
@@ -170,22 +245,22 @@ class LogoutView(APIView):
         Returns:
             Response: Success message
         """
-        try:
-            # Delete the user's token
-            request.user.auth_token.delete()
-            return Response(
-                {'message': 'Successfully logged out.'},
-                status=status.HTTP_200_OK
-            )
-        except Exception as e:
-            # Handle edge case where token doesn't exist
-            return Response(
-                {'error': 'Logout failed.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # Drop the cached authentication entry; the request's own token key
+        # is in hand unless the user authenticated by session
+        if isinstance(request.auth, Token):
+            invalidate_token(request.auth.key)
+        else:
+            invalidate_user_tokens(request.user.pk)
+
+        # Delete without fetching first; logging out twice is not an error
+        Token.objects.filter(user_id=request.user.pk).delete()
+        return Response(
+            {'message': 'Successfully logged out.'},
+            status=status.HTTP_200_OK
+        )
 
 
-class CurrentUserView(APIView):
+class CurrentUserView(SharedPermissionsMixin, APIView):
     """
     Get current authenticated user's profile information.
 
@@ -205,6 +280,9 @@ class CurrentUserView(APIView):
             "is_active": true
         }
 
+    The response carries an ETag of the profile; a request whose
+    If-None-Match matches it gets 304 Not Modified with an empty body.
+
     Error Responses:
         - 401 Unauthorized: No valid token provided
 
@@ -223,9 +301,20 @@ class CurrentUserView(APIView):
         Returns:
             Response: User profile data
         """
-        # Serialize authenticated user's data
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        # Serialize authenticated user's data (cached; invalidated on profile changes)
+        user = request.user
+        data = cache.get_or_set(
+            user_profile_cache_key(user.pk),
+            lambda: serialize_user(user),
+            USER_PROFILE_CACHE_TIMEOUT,
+        )
+
+        # The profile cache is invalidated on every change, so a digest of the
+        # cached dict changes exactly when the profile does
+        etag = _etag(json.dumps(data, sort_keys=True))
+        return _conditional_response(
+            request, etag, lambda: Response(data, status=status.HTTP_200_OK),
+        )
 
 
 class UserRegistrationView(generics.CreateAPIView):
@@ -268,7 +357,7 @@ class UserRegistrationView(generics.CreateAPIView):
     """
 
     serializer_class = UserCreateSerializer
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+    permission_classes = [IsAdminAuthenticated]
 
     def perform_create(self, serializer):
         """
@@ -277,8 +366,11 @@ class UserRegistrationView(generics.CreateAPIView):
         Args:
             serializer: Validated UserCreateSerializer
         """
-        # Save the new user (serializer handles password hashing and role assignment)
-        user = serializer.save()
+        # Save the new user (serializer handles password hashing and role
+        # assignment); the user, group membership and reviewer profile are
+        # written in one transaction so a failure leaves no partial account
+        with transaction.atomic():
+            user = serializer.save()
 
         # Log user creation for audit trail
         # Note: Could extend this to log to AuditLog model if needed
@@ -294,9 +386,18 @@ class ImportReviewersFromExcelView(APIView):
     - last_name (required)
     - username (optional, auto-generated if missing)
     - password (optional, temporary password auto-generated if missing)
+
+    With ?background=true the workbook is queued for a Celery worker and
+    the response is 202 Accepted with a job id to poll at
+    /api/auth/import-reviewers/<job_id>/.
+
+    Clients sending "Accept: application/x-ndjson" receive a streamed
+    response instead: one JSON object per row ({"status": "created" |
+    "error", ...}) followed by a {"status": "done", ...} summary line.
     """
 
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+    permission_classes = [IsAdminAuthenticated]
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, NDJSONRenderer]
 
     def post(self, request):
         upload = request.FILES.get('file')
@@ -307,97 +408,159 @@ class ImportReviewersFromExcelView(APIView):
         if not filename.endswith('.xlsx'):
             return Response({'error': 'Unsupported file type. Please upload an .xlsx file.'}, status=status.HTTP_400_BAD_REQUEST)
 
+        if request.query_params.get('background', '').lower() == 'true':
+            return self._enqueue(request, upload)
+
         try:
-            from openpyxl import load_workbook
-            workbook = load_workbook(filename=upload, data_only=True)
-            sheet = workbook.active
+            rows, close_workbook = open_xlsx_rows(upload)
         except Exception:
             return Response({'error': 'Unable to read Excel file. Ensure the file is a valid .xlsx workbook.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        rows = list(sheet.iter_rows(values_only=True))
-        if not rows:
-            return Response({'error': 'The Excel file is empty.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            parsed = ReviewerImportService.parse_rows(rows)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            close_workbook()
 
-        header = [_normalize_header(cell) for cell in rows[0]]
-        aliases = {
-            'first_name': {'first_name', 'firstname', 'first'},
-            'last_name': {'last_name', 'lastname', 'last'},
-            'email': {'email', 'email_address', 'mail'},
-            'username': {'username', 'user_name', 'user'},
-            'password': {'password', 'pass', 'temp_password'},
+        if isinstance(request.accepted_renderer, NDJSONRenderer):
+            return StreamingHttpResponse(
+                self._stream_ndjson(parsed),
+                content_type=NDJSONRenderer.media_type,
+            )
+
+        result = ReviewerImportService.run(parsed)
+        return Response(result, status=status.HTTP_200_OK)
+
+    @staticmethod
+    def _enqueue(request, upload):
+        """
+        Store the workbook and hand the import to a Celery worker.
+
+        Returns 202 with the job id; progress and the final result are read
+        from ReviewerImportJobView.
+        """
+        job = ReviewerImportJob.objects.create(created_by=request.user, file=upload)
+        transaction.on_commit(lambda: ImportReviewersFromExcelView._dispatch(job))
+        return Response({
+            'job_id': job.pk,
+            'status': job.status,
+            'status_url': reverse('users:import-reviewers-job', args=[job.pk]),
+        }, status=status.HTTP_202_ACCEPTED)
+
+    @staticmethod
+    def _dispatch(job):
+        """
+        Queue the Celery task for a stored job.
+
+        If the broker is unreachable the job is marked FAILED and its
+        encrypted upload deleted, rather than staying PENDING forever.
+        """
+        try:
+            import_reviewers_task.delay(job.pk)
+        except Exception:
+            logger.exception("Could not queue reviewer import job %s", job.pk)
+            job.file.delete(save=False)
+            ReviewerImportJob.objects.filter(pk=job.pk).update(
+                file=None,
+                status=ReviewerImportJob.Status.FAILED,
+                error='The import could not be queued. Please try again.',
+                finished_at=timezone.now(),
+            )
+
+    @staticmethod
+    def _stream_ndjson(parsed):
+        """
+        Yield one JSON line per row outcome, then a summary line.
+
+        Created rows are emitted as each bulk batch is saved, so clients can
+        show progress and the server never holds the full result.
+        """
+        counts = {'created': 0, 'error': 0}
+        for outcome, entry in ReviewerImportService.iter_import(parsed):
+            counts[outcome] += 1
+            yield json.dumps({'status': outcome, **entry}, cls=JSONEncoder) + '\n'
+        yield json.dumps({
+            'status': 'done',
+            'created_count': counts['created'],
+            'error_count': counts['error'],
+        }) + '\n'
+
+
+class ReviewerImportJobView(generics.RetrieveAPIView):
+    """
+    Poll a background reviewer import (Admin only).
+
+    GET /api/auth/import-reviewers/<id>/
+
+    Success Response (200 OK):
+        {
+            "id": 3,
+            "status": "RUNNING",
+            "total_rows": 2000,
+            "processed_rows": 1000,
+            "result": null,
+            "error": "",
+            "created_at": "2024-02-09 10:00:00",
+            "finished_at": null
         }
 
-        index_map = {}
-        for field, names in aliases.items():
-            for idx, col in enumerate(header):
-                if col in names:
-                    index_map[field] = idx
-                    break
-
-        required = ['first_name', 'last_name', 'email']
-        missing = [field for field in required if field not in index_map]
-        if missing:
-            return Response(
-                {'error': f"Missing required columns: {', '.join(missing)}"},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        created = []
-        errors = []
-
-        for row_idx, row in enumerate(rows[1:], start=2):
-            if not row or all(cell is None or str(cell).strip() == '' for cell in row):
-                continue
-
-            def _cell(field):
-                idx = index_map.get(field)
-                if idx is None or idx >= len(row):
-                    return ''
-                return str(row[idx]).strip() if row[idx] is not None else ''
-
-            first_name = _cell('first_name')
-            last_name = _cell('last_name')
-            email = _cell('email')
-            username = _cell('username') or _generate_unique_username(email)
-            password = _cell('password') or _generate_temp_password()
-
-            payload = {
-                'username': username,
-                'email': email,
-                'password': password,
-                'first_name': first_name,
-                'last_name': last_name,
-                'role': 'Reviewer',
-            }
-
-            serializer = UserCreateSerializer(data=payload)
-            if serializer.is_valid():
-                user = serializer.save()
-                created_row = {
-                    'row': row_idx,
-                    'id': user.id,
-                    'email': user.email,
-                    'username': user.username,
-                }
-                if 'password' not in index_map or not _cell('password'):
-                    created_row['temporary_password'] = password
-                created.append(created_row)
-            else:
-                errors.append({
-                    'row': row_idx,
-                    'email': email,
-                    'errors': serializer.errors,
-                })
+    Authentication: Required (Token)
+    Permissions: Admin users only (is_staff=True)
+    """
 
-        return Response({
-            'created_count': len(created),
-            'error_count': len(errors),
-            'created': created,
-            'errors': errors,
-        }, status=status.HTTP_200_OK)
+    serializer_class = ReviewerImportJobSerializer
+    permission_classes = [IsAdminAuthenticated]
+    queryset = ReviewerImportJob.objects.all()
+
+
+class ReviewerImportCredentialsView(APIView):
+    """
+    One-time download of a background import's temporary passwords (Admin only).
+
+    GET /api/auth/import-reviewers/<id>/credentials/
+
+    The encrypted credentials file is deleted as it is served, so a second
+    request returns 404.
+
+    Success Response (200 OK):
+        {
+            "job_id": 3,
+            "credentials": [
+                {"row": 2, "email": "grace@nsu.edu", "username": "grace",
+                 "temporary_password": "Rvwr!..."}
+            ]
+        }
+
+    Error Responses:
+        - 404 Not Found: Unknown job, or credentials already downloaded
+
+    Authentication: Required (Token)
+    Permissions: Admin users only (is_staff=True)
+    """
+
+    permission_classes = [IsAdminAuthenticated]
+
+    def get(self, request, pk):
+        with transaction.atomic():
+            # Row lock so two concurrent downloads cannot both read the file
+            job = ReviewerImportJob.objects.select_for_update().filter(pk=pk).first()
+            if job is None or not job.credentials:
+                return Response(
+                    {'error': 'No credentials available for this import. They may have been downloaded already.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            with job.credentials.open('rb') as stored:
+                credentials = json.loads(stored.read())
+            job.credentials.delete(save=False)
+            job.save(update_fields=['credentials'])
+
+        response = Response({'job_id': job.pk, 'credentials': credentials})
+        patch_cache_control(response, no_store=True)
+        return response
 
 
-class ChangePasswordView(APIView):
+class ChangePasswordView(SharedPermissionsMixin, APIView):
     """
     Change user password.
 
@@ -446,8 +609,11 @@ class ChangePasswordView(APIView):
         )
         serializer.is_valid(raise_exception=True)
 
-        # Save new password (serializer handles hashing)
-        serializer.save()
+        # Save new password (serializer handles hashing); cached tokens are
+        # dropped only once the new hash is committed
+        with transaction.atomic():
+            user = serializer.save()
+            transaction.on_commit(lambda: invalidate_user_tokens(user.pk))
 
         return Response(
             {'message': 'Password successfully changed.'},
@@ -467,6 +633,7 @@ class UserListView(generics.ListAPIView):
     Query Parameters:
         - role: Filter by role (optional) - e.g., ?role=Reviewer
         - is_active: Filter by active status (optional) - e.g., ?is_active=true
+        - page / page_size: Pagination (page_size defaults to 50, at most 200)
 
     Success Response (200 OK):
         [
@@ -497,8 +664,10 @@ class UserListView(generics.ListAPIView):
     """
 
     serializer_class = UserListSerializer
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
-    queryset = User.objects.all().order_by('-date_joined')
+    permission_classes = [IsAdminAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = CachedCountPagination
+    queryset = User.objects.with_role().with_full_name().order_by('-date_joined')
 
     def get_queryset(self):
         """
@@ -515,17 +684,45 @@ class UserListView(generics.ListAPIView):
 
         # Filter by role if provided
         role = self.request.query_params.get('role', None)
-        if role:
-            queryset = queryset.filter(groups__name=role)
+        if role in UserQuerySet.ROLE_NAMES:
+            # Known roles resolve to a cached group, so no auth_group join
+            group = _find_role_group(role)
+            queryset = queryset.in_group(group) if group is not None else queryset.none()
+        elif role:
+            queryset = queryset.in_role(role)
 
         # Filter by active status if provided
-        is_active = self.request.query_params.get('is_active', None)
+        is_active = _BOOL_MAP.get(self.request.query_params.get('is_active', '').lower())
         if is_active is not None:
-            is_active_bool = is_active.lower() == 'true'
-            queryset = queryset.filter(is_active=is_active_bool)
+            queryset = queryset.filter(is_active=is_active)
 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        Render listing rows straight from ``values()`` dicts.
+
+        Every field is computed in SQL (see UserQuerySet), so rows bypass
+        per-field serializer dispatch; UserListSerializer still documents
+        the row shape. The ETag covers the listing version and the exact
+        query, so an unchanged page is answered with 304 before any SQL runs.
+        """
+        etag = _etag(user_listing_version(), request.accepted_renderer.format, request.get_full_path())
+        return _conditional_response(request, etag, self._list_response)
+
+    def _list_response(self):
+        """Build the listing response for the current request."""
+        queryset = self.filter_queryset(self.get_queryset()).values(*USER_LIST_FIELDS)
+        page = self.paginate_queryset(queryset)
+        rows = list(page if page is not None else queryset)
+        # Honours DATETIME_FORMAT and the current timezone like the serializer
+        date_field = serializers.DateTimeField()
+        for row in rows:
+            row['date_joined'] = date_field.to_representation(row['date_joined'])
+        if page is not None:
+            return self.get_paginated_response(rows)
+        return Response(rows)
+
 
 # Additional view for user detail/update/delete (optional enhancement)
 class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -549,10 +746,36 @@ class UserDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
 
     serializer_class = UserSerializer
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
-    queryset = User.objects.all()
+    permission_classes = [IsAdminAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    # Only the rendered columns are loaded; saves write just those back
+    queryset = User.objects.only(*USER_PROFILE_COLUMNS).with_role()
     lookup_field = 'pk'
 
+    def perform_update(self, serializer):
+        """
+        Save user changes and drop the user's cached profile.
+
+        Args:
+            serializer: Validated UserSerializer
+        """
+        user = serializer.save()
+        invalidate_user_profile(user.pk)
+        # is_active may have changed - cached token lookups must not outlive it
+        invalidate_user_tokens(user.pk)
+
+    def perform_destroy(self, instance):
+        """
+        Delete the user and drop the user's cached profile.
+
+        Args:
+            instance (User): User to delete
+        """
+        user_id = instance.pk
+        invalidate_user_tokens(user_id)
+        instance.delete()
+        invalidate_user_profile(user_id)
+
 
 class ReviewerPublicRegistrationView(generics.CreateAPIView):
     """
@@ -633,7 +856,9 @@ class PendingReviewersView(generics.ListAPIView):
     """
 
     serializer_class = UserListSerializer
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+    permission_classes = [IsAdminAuthenticated]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    pagination_class = UserPagination
 
     def get_queryset(self):
         """
@@ -642,8 +867,11 @@ class PendingReviewersView(generics.ListAPIView):
         Returns:
             QuerySet: Inactive users in the Reviewer group
         """
-        return User.objects.filter(
-            groups__name='Reviewer',
+        reviewer_group = _find_role_group('Reviewer')
+        if reviewer_group is None:
+            return User.objects.none()
+        return User.objects.only(*USER_LIST_COLUMNS).with_role().with_full_name().filter(
+            groups=reviewer_group,
             is_active=False
         ).order_by('-date_joined')
 
@@ -703,19 +931,17 @@ class ApproveReviewerView(APIView):
         Response: {"message": "Reviewer approved successfully.", "user": {...}}
     """
 
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+    permission_classes = [IsAdminAuthenticated]
 
     def post(self, request, pk):
         """
         Approve pending reviewer and activate their account.
 
         WORKFLOW:
-        1. Fetch user by ID
-        2. Validate user is in Reviewer group
-        3. Check if already active (prevent duplicate approvals)
-        4. Set User.is_active = True
-        5. Set ReviewerProfile.is_active_reviewer = True
-        6. Return success response
+        1. Set User.is_active and ReviewerProfile.is_active_reviewer if the
+           user is an inactive reviewer (ReviewerApprovalService)
+        2. Otherwise report not found / not a reviewer / already approved
+        3. Return success response
 
         Args:
             request: HTTP request with authentication token
@@ -726,68 +952,76 @@ class ApproveReviewerView(APIView):
                      OR error message (400/404)
         """
         # ====================================================================
-        # STEP 1: Fetch user and validate existence
+        # STEP 1: Activate user and reviewer profile (shared with bulk path)
         # ====================================================================
-        try:
-            user = User.objects.get(pk=pk)
-        except User.DoesNotExist:
-            return Response(
-                {'error': 'User not found.'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        result = ReviewerApprovalService.approve([pk])
 
         # ====================================================================
-        # STEP 2: Validate user is in Reviewer group
+        # STEP 2: Explain a refused approval
         # ====================================================================
-        # Safety check: Only approve users who are actually reviewers
-        if not user.groups.filter(name='Reviewer').exists():
+        if result['rejected']:
+            rejection = result['rejected'][0]
+            not_found = rejection['reason'] == ReviewerApprovalService.NOT_FOUND
             return Response(
-                {'error': 'User is not a reviewer.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # ====================================================================
-        # STEP 3: Check if already active
-        # ====================================================================
-        # Prevent duplicate approvals (idempotency check)
-        if user.is_active:
-            return Response(
-                {'error': 'Reviewer is already approved.'},
-                status=status.HTTP_400_BAD_REQUEST
+                {'error': rejection['error']},
+                status=status.HTTP_404_NOT_FOUND if not_found else status.HTTP_400_BAD_REQUEST
             )
 
         # ====================================================================
-        # STEP 4: Activate user account
-        # ====================================================================
-        # Setting is_active=True enables login functionality
-        user.is_active = True
-        user.save()
-
-        # ====================================================================
-        # STEP 5: Activate reviewer profile
+        # STEP 3: Return success response
         # ====================================================================
-        # ReviewerProfile must also be activated to receive review assignments
-        try:
-            from reviews.models import ReviewerProfile
-            reviewer_profile = ReviewerProfile.objects.get(user=user)
-            reviewer_profile.is_active_reviewer = True
-            reviewer_profile.save()
-        except ReviewerProfile.DoesNotExist:
-            # Profile doesn't exist - this shouldn't happen in normal flow
-            # (created automatically during registration)
-            # Handle gracefully - approval still succeeds
-            pass
-
-        # ====================================================================
-        # STEP 6: Return success response
-        # ====================================================================
-        serializer = UserSerializer(user)
+        # Same keys as UserSerializer, read as one narrow row
+        user_data = User.objects.with_role().values(*USER_PROFILE_FIELDS).get(pk=pk)
         return Response({
             'message': 'Reviewer approved successfully.',
-            'user': serializer.data
+            'user': user_data
         }, status=status.HTTP_200_OK)
 
 
+class ApproveReviewersBulkView(APIView):
+    """
+    Approve several pending reviewer registrations in one request (Admin only).
+
+    POST /api/auth/approve-reviewers/
+
+    Request Body:
+        {"ids": [4, 7, 9]}
+
+    Success Response (200 OK):
+        {
+            "approved": [4, 9],
+            "rejected": [
+                {"id": 7, "reason": "already_active", "error": "Reviewer is already approved."}
+            ]
+        }
+
+    Error Responses:
+        - 400 Bad Request: Missing or invalid id list
+        - 401 Unauthorized: Not authenticated
+        - 403 Forbidden: Not an admin user
+
+    Authentication: Required (Token)
+    Permissions: Admin users only (is_staff=True)
+    """
+
+    permission_classes = [IsAdminAuthenticated]
+
+    def post(self, request):
+        """
+        Activate every pending reviewer in the submitted id list.
+
+        Args:
+            request: HTTP request with an "ids" list
+
+        Returns:
+            Response: Approved ids and per-id rejection reasons
+        """
+        serializer = ReviewerBulkApprovalSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = ReviewerApprovalService.approve(serializer.validated_data['ids'])
+        return Response(result, status=status.HTTP_200_OK)
+
+
 class RejectReviewerView(APIView):
     """
     ============================================================================
@@ -803,7 +1037,7 @@ class RejectReviewerView(APIView):
     1. Validates user exists and is a pending reviewer
     2. PERMANENTLY DELETES the user account
     3. CASCADE DELETES associated ReviewerProfile
-    4. Returns success message
+    4. Returns 204 No Content
 
     ⚠️ WARNING: This is a DESTRUCTIVE operation!
     - User account is permanently deleted
@@ -820,10 +1054,8 @@ class RejectReviewerView(APIView):
     - Requires authentication (token)
     - Requires admin status (is_staff=True or SRC_Chair group)
 
-    SUCCESS RESPONSE (200 OK):
-        {
-            "message": "Reviewer registration rejected."
-        }
+    SUCCESS RESPONSE (204 No Content):
+        Empty body
 
     ERROR RESPONSES:
         - 400 Bad Request: User is active or not a reviewer
@@ -835,73 +1067,59 @@ class RejectReviewerView(APIView):
         DELETE /api/auth/reject-reviewer/5/
         Authorization: Token abc123...
 
-        Response: {"message": "Reviewer registration rejected."}
+        Response: 204 No Content
     """
 
-    permission_classes = [permissions.IsAuthenticated, permissions.IsAdminUser]
+    permission_classes = [IsAdminAuthenticated]
 
     def delete(self, request, pk):
         """
         Reject pending reviewer registration by deleting the account.
 
         WORKFLOW:
-        1. Fetch user by ID
-        2. Validate user is in Reviewer group
-        3. Check user is inactive (prevent deleting active reviewers)
-        4. Delete user account (CASCADE deletes ReviewerProfile)
-        5. Return success response
+        1. Delete the user if it is an inactive reviewer (CASCADE deletes
+           ReviewerProfile)
+        2. Otherwise report not found / not a reviewer / still active
+        3. Return 204 No Content
 
         Args:
             request: HTTP request with authentication token
             pk: User ID (primary key)
 
         Returns:
-            Response: Success message (200 OK) OR error message (400/404)
+            Response: Empty (204 No Content) OR error message (400/404)
         """
         # ====================================================================
-        # STEP 1: Fetch user and validate existence
+        # STEP 1: DELETE the account if it is a pending reviewer
         # ====================================================================
-        try:
-            user = User.objects.get(pk=pk)
-        except User.DoesNotExist:
+        # DESTRUCTIVE - cannot be undone. The DELETE's WHERE clause carries
+        # the reviewer and inactive checks, so active reviewers are never
+        # matched. Django's cascade also deletes the ReviewerProfile.
+        reason = ReviewerApprovalService.reject(pk)
+
+        # ====================================================================
+        # STEP 2: Explain a refused rejection
+        # ====================================================================
+        if reason == ReviewerApprovalService.NOT_FOUND:
             return Response(
                 {'error': 'User not found.'},
                 status=status.HTTP_404_NOT_FOUND
             )
-
-        # ====================================================================
-        # STEP 2: Validate user is in Reviewer group
-        # ====================================================================
-        # Safety check: Only reject reviewer accounts
-        if not user.groups.filter(name='Reviewer').exists():
+        if reason == ReviewerApprovalService.NOT_REVIEWER:
+            # Safety check: Only reject reviewer accounts
             return Response(
                 {'error': 'User is not a reviewer.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-
-        # ====================================================================
-        # STEP 3: CRITICAL SAFETY CHECK - Prevent deletion of active users
-        # ====================================================================
-        # This prevents accidentally deleting reviewers who are already
-        # approved and working in the system
-        if user.is_active:
+        if reason == ReviewerApprovalService.ALREADY_ACTIVE:
+            # Reviewers who are already approved and working in the system
+            # must be deactivated instead
             return Response(
                 {'error': 'Cannot reject an active reviewer. Use the deactivate endpoint instead.'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
         # ====================================================================
-        # STEP 4: DELETE user account (DESTRUCTIVE - Cannot be undone!)
-        # ====================================================================
-        # Django's cascade deletion will also delete:
-        # - ReviewerProfile (ForeignKey to User)
-        # - Any other related objects
-        user.delete()
-
-        # ====================================================================
-        # STEP 5: Return success response
+        # STEP 3: Return success response
         # ====================================================================
-        return Response(
-            {'message': 'Reviewer registration rejected.'},
-            status=status.HTTP_200_OK
-        )
+        return Response(status=status.HTTP_204_NO_CONTENT)